@@ -1,3 +1,11 @@
+import bisect
+import sys
+import time
+import tracemalloc
+from array import array
+from enum import IntEnum
+
+
 class Vehicle:
     def __init__(self, make, model, year):
         self.make = make
@@ -46,6 +54,306 @@ class Bike(Vehicle):
         return f"{base_info} ({self.bike_type})"
 
 
+# Memory-compact variants: __slots__ replaces the per-instance __dict__
+# with fixed attribute slots. Every class in the hierarchy must declare
+# __slots__ (subclasses list only the attributes they add), otherwise a
+# __dict__ sneaks back in.
+class SlottedVehicle:
+    __slots__ = ("make", "model", "year")
+
+    def __init__(self, make, model, year):
+        self.make = make
+        self.model = model
+        self.year = year
+    
+    def display_info(self):
+        return f"{self.year} {self.make} {self.model}"
+    
+    def start_engine(self):
+        return "Engine starting..."
+    
+    def get_type(self):
+        return "Generic Vehicle"
+
+
+class SlottedCar(SlottedVehicle):
+    __slots__ = ("doors",)
+
+    def __init__(self, make, model, year, doors):
+        super().__init__(make, model, year)
+        self.doors = doors
+    
+    def start_engine(self):  # Method override
+        return "Car engine starting with a smooth purr..."
+    
+    def get_type(self):  # Method override
+        return "Car"
+    
+    def display_info(self):  # Method override with extension
+        base_info = super().display_info()
+        return f"{base_info} ({self.doors}-door)"
+
+
+class SlottedBike(SlottedVehicle):
+    __slots__ = ("bike_type",)
+
+    def __init__(self, make, model, year, bike_type):
+        super().__init__(make, model, year)
+        self.bike_type = bike_type
+    
+    def start_engine(self):  # Method override
+        return "Bike engine starting with a loud roar!"
+    
+    def get_type(self):  # Method override
+        return f"{self.bike_type} Bike"
+    
+    def display_info(self):  # Method override with extension
+        base_info = super().display_info()
+        return f"{base_info} ({self.bike_type})"
+
+
+def bytes_per_instance(factory, n=100_000):
+    """Average memory allocated per object, measured with tracemalloc"""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        objects = [factory(i) for i in range(n)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    # Subtract the list holding the objects so only the objects are counted
+    return (after - before - objects.__sizeof__()) / n
+
+
+def benchmark_memory(n=100_000):
+    """Report bytes per instance for the regular and __slots__ classes"""
+    pairs = [
+        ("Vehicle", lambda i: Vehicle("Generic", "Model", i),
+                    lambda i: SlottedVehicle("Generic", "Model", i)),
+        ("Car", lambda i: Car("Toyota", "Camry", i, 4),
+                lambda i: SlottedCar("Toyota", "Camry", i, 4)),
+        ("Bike", lambda i: Bike("Harley-Davidson", "Sportster", i, "Cruiser"),
+                 lambda i: SlottedBike("Harley-Davidson", "Sportster", i, "Cruiser")),
+    ]
+    print(f"Bytes per instance ({n:,} instances each):")
+    results = {}
+    for name, regular, slotted in pairs:
+        before = bytes_per_instance(regular, n)
+        after = bytes_per_instance(slotted, n)
+        results[name] = (before, after)
+        print(f"  {name:8} __dict__: {before:6.1f}   __slots__: {after:6.1f}   saved: {1 - after / before:.0%}")
+    return results
+
+
+class VehicleKind(IntEnum):
+    VEHICLE = 0
+    CAR = 1
+    BIKE = 2
+
+
+class VehicleFleet:
+    """
+    Columnar store for a large inventory of vehicles.
+
+    Each attribute lives in its own column: make, model and bike type are
+    dictionary-encoded (an interned string table plus integer codes), year
+    and doors are typed arrays and the kind is a one-byte VehicleKind code.
+    Hash indexes by make and kind plus a year index (with a sorted list of
+    years for range queries) answer queries such as "all 2021
+    Harley-Davidson bikes" without looking at any other rows. Descriptions
+    are only rendered for the rows a query returns.
+    """
+
+    def __init__(self, vehicles=()):
+        self._strings = []          # code -> string
+        self._codes = {}            # string -> code
+        self.kind = array('B')
+        self.make = array('I')
+        self.model = array('I')
+        self.year = array('h')
+        self.doors = array('b')     # 0 for rows that are not cars
+        self.bike_type = array('i')  # -1 for rows that are not bikes
+        self._by_make = {}          # make code -> list of rows
+        self._by_kind = {kind: [] for kind in VehicleKind}
+        self._by_year = {}          # year -> list of rows
+        self._years = []            # sorted distinct years
+        for vehicle in vehicles:
+            self.append(vehicle)
+
+    def _encode(self, text):
+        code = self._codes.get(text)
+        if code is None:
+            text = sys.intern(text)  # Raises TypeError before anything is stored
+            code = self._codes[text] = len(self._strings)
+            self._strings.append(text)
+        return code
+
+    def add(self, kind, make, model, year, doors=0, bike_type=None):
+        """Append one row and return its row number"""
+        kind = VehicleKind(kind)
+        # Validate and encode every field before any column is touched, so a
+        # bad row raises without leaving the columns out of step
+        if not isinstance(bike_type, str) and kind is VehicleKind.BIKE:
+            raise TypeError("a bike needs a bike_type string")
+        array('h', (year,))     # OverflowError/TypeError like the column itself
+        if kind is not VehicleKind.CAR:
+            doors = 0
+        array('b', (doors,))
+        row = len(self.kind)
+        make_code = self._encode(make)
+        model_code = self._encode(model)
+        bike_code = self._encode(bike_type) if kind is VehicleKind.BIKE else -1
+        self.kind.append(kind)
+        self.make.append(make_code)
+        self.model.append(model_code)
+        self.year.append(year)
+        self.doors.append(doors)
+        self.bike_type.append(bike_code)
+
+        self._by_make.setdefault(make_code, []).append(row)
+        self._by_kind[kind].append(row)
+        rows = self._by_year.get(year)
+        if rows is None:
+            rows = self._by_year[year] = []
+            bisect.insort(self._years, year)
+        rows.append(row)
+        return row
+
+    def append(self, vehicle):
+        """Append a Vehicle, Car or Bike (regular or slotted) object"""
+        if isinstance(vehicle, (Car, SlottedCar)):
+            return self.add(VehicleKind.CAR, vehicle.make, vehicle.model, vehicle.year,
+                            doors=vehicle.doors)
+        if isinstance(vehicle, (Bike, SlottedBike)):
+            return self.add(VehicleKind.BIKE, vehicle.make, vehicle.model, vehicle.year,
+                            bike_type=vehicle.bike_type)
+        return self.add(VehicleKind.VEHICLE, vehicle.make, vehicle.model, vehicle.year)
+
+    def __len__(self):
+        return len(self.kind)
+
+    def query(self, make=None, year=None, kind=None, year_range=None):
+        """
+        Return a FleetResult with the rows matching every given criterion.
+
+        Args:
+            make: Exact make, e.g. "Harley-Davidson"
+            year: Exact model year
+            kind: A VehicleKind
+            year_range: (first, last) inclusive range of years
+        """
+        checks = []       # (candidate rows, column, accepted values)
+        if make is not None:
+            make_code = self._codes.get(make, -1)
+            checks.append((self._by_make.get(make_code, []), self.make, (make_code,)))
+        if year is not None:
+            checks.append((self._by_year.get(year, []), self.year, (year,)))
+        if kind is not None:
+            kind = VehicleKind(kind)
+            checks.append((self._by_kind[kind], self.kind, (kind,)))
+        if year_range is not None:
+            first, last = year_range
+            start = bisect.bisect_left(self._years, first)
+            stop = bisect.bisect_right(self._years, last)
+            years = self._years[start:stop]
+            rows = []
+            for each_year in years:
+                rows.extend(self._by_year[each_year])
+            rows.sort()
+            checks.append((rows, self.year, set(years)))
+        if not checks:
+            return FleetResult(self, range(len(self)))
+
+        # Walk the smallest index; the other criteria are O(1) column probes
+        checks.sort(key=lambda check: len(check[0]))
+        rows = list(checks[0][0])  # A copy: the index lists keep growing on add()
+        for _, column, accepted in checks[1:]:
+            rows = [row for row in rows if column[row] in accepted]
+        return FleetResult(self, rows)
+
+    def get_type(self, row):
+        kind = self.kind[row]
+        if kind == VehicleKind.CAR:
+            return "Car"
+        if kind == VehicleKind.BIKE:
+            return f"{self._strings[self.bike_type[row]]} Bike"
+        return "Generic Vehicle"
+
+    def display_info(self, row):
+        """Same text as display_info() on the matching Vehicle object"""
+        info = f"{self.year[row]} {self._strings[self.make[row]]} {self._strings[self.model[row]]}"
+        kind = self.kind[row]
+        if kind == VehicleKind.CAR:
+            return f"{info} ({self.doors[row]}-door)"
+        if kind == VehicleKind.BIKE:
+            return f"{info} ({self._strings[self.bike_type[row]]})"
+        return info
+
+    def to_vehicle(self, row):
+        """Materialize one row as a Vehicle, Car or Bike object"""
+        make = self._strings[self.make[row]]
+        model = self._strings[self.model[row]]
+        kind = self.kind[row]
+        if kind == VehicleKind.CAR:
+            return Car(make, model, self.year[row], self.doors[row])
+        if kind == VehicleKind.BIKE:
+            return Bike(make, model, self.year[row], self._strings[self.bike_type[row]])
+        return Vehicle(make, model, self.year[row])
+
+
+class FleetResult:
+    """Row numbers returned by VehicleFleet.query(); renders text lazily"""
+
+    def __init__(self, fleet, rows):
+        self.fleet = fleet
+        self.rows = rows
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def display_info(self):
+        """Generate display strings one row at a time"""
+        return (self.fleet.display_info(row) for row in self.rows)
+
+    def to_vehicles(self):
+        return [self.fleet.to_vehicle(row) for row in self.rows]
+
+
+def benchmark_fleet_query(n=300_000):
+    """Compare a loop over objects with an indexed VehicleFleet query"""
+    makes = ["Toyota", "Honda", "Ford", "Harley-Davidson", "Yamaha", "BMW"]
+    vehicles = []
+    for i in range(n):
+        make = makes[(i // 3) % len(makes)]
+        year = 2000 + (i // 7) % 25
+        if i % 3 == 0:
+            vehicles.append(Car(make, "Model", year, 2 + 2 * (i % 2)))
+        elif i % 3 == 1:
+            vehicles.append(Bike(make, "Model", year, "Cruiser"))
+        else:
+            vehicles.append(Vehicle(make, "Model", year))
+    fleet = VehicleFleet(vehicles)
+
+    start = time.perf_counter()
+    loop_matches = [v.display_info() for v in vehicles
+                    if v.get_type().endswith("Bike") and v.make == "Harley-Davidson" and v.year == 2021]
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = fleet.query(make="Harley-Davidson", year=2021, kind=VehicleKind.BIKE)
+    fleet_matches = list(result.display_info())
+    fleet_time = time.perf_counter() - start
+
+    assert loop_matches == fleet_matches
+    print(f"'2021 Harley-Davidson bikes' over {n:,} vehicles ({len(fleet_matches)} matches):")
+    print(f"  object loop:    {loop_time * 1000:8.2f} ms")
+    print(f"  fleet query:    {fleet_time * 1000:8.2f} ms")
+    return loop_time, fleet_time
+
+
 # Demonstration
 if __name__ == "__main__":
     # Create instances
@@ -61,4 +369,24 @@ if __name__ == "__main__":
         print(f"Type: {vehicle.get_type()}")
         print(f"Info: {vehicle.display_info()}")
         print(f"Start: {vehicle.start_engine()}")
-        print("-" * 30)
\ No newline at end of file
+        print("-" * 30)
+    
+    print("\n=== __slots__ Variants ===")
+    for vehicle in [SlottedVehicle("Generic", "Model", 2023),
+                    SlottedCar("Toyota", "Camry", 2022, 4),
+                    SlottedBike("Harley-Davidson", "Sportster", 2021, "Cruiser")]:
+        print(f"{vehicle.get_type()}: {vehicle.display_info()} - {vehicle.start_engine()}")
+    
+    print("\n=== Vehicle Fleet ===")
+    fleet = VehicleFleet(vehicles + [Bike("Harley-Davidson", "Street Glide", 2021, "Touring"),
+                                     Bike("Yamaha", "MT-07", 2021, "Naked")])
+    for info in fleet.query(make="Harley-Davidson", year=2021, kind=VehicleKind.BIKE).display_info():
+        print(f"Match: {info}")
+    print(f"2021-2022: {list(fleet.query(year_range=(2021, 2022)).display_info())}")
+    
+    # Benchmarks take a while: run them with --benchmark
+    if '--benchmark' in sys.argv:
+        print()
+        benchmark_memory()
+        print()
+        benchmark_fleet_query()
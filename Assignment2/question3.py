@@ -1,53 +1,132 @@
+import math
+import sys
+import time
+
+
 class Shape:
+    # Set Shape.verbose = False (or shape.verbose = False) to silence the
+    # progress messages; the hot path then skips the string formatting too.
+    verbose = True
+    # Attributes whose assignment invalidates the cached area
+    dimensions = ()
+
     def __init__(self, name="Shape"):
         self.name = name
-        self.area_calculated = False  # Common initialization logic
-        print(f"Initializing {self.name} - setting up area calculation framework")
-    
+        self._area = None  # Common initialization logic: nothing cached yet
+        if self.verbose:
+            print(f"Initializing {self.name} - setting up area calculation framework")
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in self.dimensions:
+            # A dimension changed, so the cached area is stale
+            super().__setattr__("_area", None)
+
+    @property
+    def area_calculated(self):
+        """True while a cached area is available"""
+        return self._area is not None
+
     def calculate_area(self):
-        """Base method that does nothing - meant to be overridden"""
-        self.area_calculated = True
-        print(f"Area calculation completed for {self.name}")
-        return 0
+        """
+        Base method - meant to be overridden. Holds the common logic and
+        the memoization: returns the cached area when one is valid (see
+        area_calculated), else 0; overrides store what they compute in
+        self._area.
+        """
+        if self.verbose:
+            print(f"Area calculation completed for {self.name}")
+        area = self._area
+        return 0 if area is None else area
+
+    def invalidate_area(self):
+        """Drop the cached area so the next call recomputes it"""
+        self._area = None
 
 
 class Rectangle(Shape):
+    dimensions = ("width", "height")
+
     def __init__(self, width, height, name="Rectangle"):
         # Use super() to call the parent class constructor
         super().__init__(name)
         self.width = width
         self.height = height
-        print(f"Rectangle specific initialization: {width}x{height}")
-    
+        if self.verbose:
+            print(f"Rectangle specific initialization: {width}x{height}")
+
     def calculate_area(self):
         # First call the parent's calculate_area method using super()
-        # This executes the common logic in the base class
-        super().calculate_area()
+        # This executes the common logic in the base class, cache lookup included
+        area = super().calculate_area()
+        if self.area_calculated:
+            return area
         
         # Then perform the rectangle-specific area calculation
-        area = self.width * self.height
-        print(f"Rectangle area calculation: {self.width} * {self.height} = {area}")
+        area = self._area = self.width * self.height
+        if self.verbose:
+            print(f"Rectangle area calculation: {self.width} * {self.height} = {area}")
         return area
 
 
 class Circle(Shape):
+    dimensions = ("radius",)
+
     def __init__(self, radius, name="Circle"):
         # Call parent constructor using super()
         super().__init__(name)
         self.radius = radius
-        print(f"Circle specific initialization: radius {radius}")
-    
+        if self.verbose:
+            print(f"Circle specific initialization: radius {radius}")
+
     def calculate_area(self):
-        # Call parent's method for common functionality
-        super().calculate_area()
+        # Call parent's method for common functionality (and the cached area)
+        area = super().calculate_area()
+        if self.area_calculated:
+            return area
         
         # Circle-specific calculation
-        import math
-        area = math.pi * self.radius ** 2
-        print(f"Circle area calculation: π * {self.radius}² = {area:.2f}")
+        area = self._area = math.pi * self.radius ** 2
+        if self.verbose:
+            print(f"Circle area calculation: π * {self.radius}² = {area:.2f}")
         return area
 
 
+def benchmark_calculate_area(n=200_000):
+    """Time cold, warm (cached) and invalidated calculate_area() calls"""
+    previous_verbose = Shape.verbose
+    Shape.verbose = False
+    try:
+        shapes = [Rectangle(i % 10 + 1, 2) if i % 2 else Circle(i % 10 + 1) for i in range(n)]
+
+        start = time.perf_counter()
+        for shape in shapes:
+            shape.calculate_area()
+        cold = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for shape in shapes:
+            shape.calculate_area()
+        warm = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for shape in shapes:
+            if isinstance(shape, Rectangle):
+                shape.width += 1
+            else:
+                shape.radius += 1
+            shape.calculate_area()
+        invalidated = time.perf_counter() - start
+    finally:
+        Shape.verbose = previous_verbose
+
+    print(f"calculate_area() on {n:,} shapes (verbose off):")
+    print(f"  cold:        {cold / n * 1e9:7.1f} ns/call")
+    print(f"  warm:        {warm / n * 1e9:7.1f} ns/call")
+    print(f"  invalidated: {invalidated / n * 1e9:7.1f} ns/call (includes the assignment)")
+    return cold, warm, invalidated
+
+
 # Demonstration
 if __name__ == "__main__":
     print("=== Creating Rectangle ===")
@@ -73,4 +152,22 @@ if __name__ == "__main__":
     for shape in shapes:
         print(f"\nCalculating area for {shape.name}:")
         area = shape.calculate_area()
-        print(f"Area: {area:.2f}")
\ No newline at end of file
+        print(f"Area: {area:.2f}")
+    
+    print("\n" + "="*40 + "\n")
+    
+    # Caching: the second call is served from the cache (only the base class
+    # message is printed), and assigning a dimension forces a recomputation
+    print("=== Area Caching ===")
+    rectangle = Rectangle(5, 3)
+    print(f"Cached? {rectangle.area_calculated}")
+    rectangle.calculate_area()
+    print(f"Cached? {rectangle.area_calculated} -> {rectangle.calculate_area()}")
+    rectangle.width = 10
+    print(f"After width change, cached? {rectangle.area_calculated}")
+    print(f"New area: {rectangle.calculate_area()}")
+    
+    # The benchmark takes a while: run it with --benchmark
+    if '--benchmark' in sys.argv:
+        print()
+        benchmark_calculate_area()
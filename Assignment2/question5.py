@@ -1,13 +1,180 @@
 from abc import ABC, abstractmethod
+import asyncio
+import bz2
+import contextlib
+import csv
+import errno
+import gzip
+import io
 import json
+import lzma
+import mmap
+import os
 import pickle
+import stat
+import struct
+import sys
+import threading
+import time
+import tracemalloc
+import weakref
+import zlib
+from array import array
+from collections import OrderedDict, namedtuple
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import accumulate
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024  # 1 MiB per read_iter() chunk
+
+# Supported codecs: name -> (module, file extensions, name of the level argument)
+COMPRESSION_CODECS = {
+    'gzip': (gzip, ('.gz',), 'compresslevel'),
+    'bz2': (bz2, ('.bz2',), 'compresslevel'),
+    'lzma': (lzma, ('.xz', '.lzma'), 'preset'),
+}
+
+
+def detect_compression(filename):
+    """Name of the codec implied by the file extension, or None"""
+    for name, (_, extensions, _) in COMPRESSION_CODECS.items():
+        if filename.endswith(extensions):
+            return name
+    return None
+
+
+def _pread(fd, size, offset):
+    """os.pread() with a seek + read fallback for platforms without it"""
+    if hasattr(os, 'pread'):
+        return os.pread(fd, size, offset)
+    os.lseek(fd, offset, os.SEEK_SET)
+    return os.read(fd, size)
+
+
+def _pwrite_all(fd, data, offset):
+    """
+    Write all of data at offset, retrying short writes. offset None writes
+    at the descriptor's position (always the end for O_APPEND descriptors).
+    """
+    view = memoryview(data).cast('B')
+    while view:
+        if offset is None:
+            written = os.write(fd, view)
+        elif hasattr(os, 'pwrite'):
+            written = os.pwrite(fd, view, offset)
+        else:
+            os.lseek(fd, offset, os.SEEK_SET)
+            written = os.write(fd, view)
+        view = view[written:]
+        if offset is not None:
+            offset += written
+
+
+_MISS = object()  # Sentinel for "not in the cache"
+
+
+class ReadCache:
+    """
+    Size-bounded LRU cache of parsed file contents, shared by handlers.
+    
+    Entries are keyed on the handler type and absolute path and stamped
+    with the file's (st_mtime_ns, st_size); a lookup whose stamp no longer
+    matches drops the stale entry, so changed files are re-read
+    automatically. The byte budget is charged with the uncompressed size
+    of the file contents.
+    Cached values are shared between callers and must not be mutated.
+    """
+    
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()  # key -> (stamp, value, nbytes)
+        self._lock = threading.Lock()
+    
+    def get(self, key, stamp):
+        """Return the cached value, or _MISS if absent or stale"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != stamp:
+                if entry is not None:
+                    self._discard(key)
+                self.misses += 1
+                return _MISS
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+    
+    def put(self, key, stamp, value, nbytes):
+        """Store a value, evicting least recently used entries over budget"""
+        with self._lock:
+            self._discard(key)
+            if nbytes > self.max_bytes:
+                return
+            self._entries[key] = (stamp, value, nbytes)
+            self.current_bytes += nbytes
+            while self.current_bytes > self.max_bytes:
+                _, (_, _, evicted_bytes) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_bytes
+                self.evictions += 1
+    
+    def invalidate(self, key):
+        with self._lock:
+            self._discard(key)
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+    
+    def _discard(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.current_bytes -= entry[2]
+    
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "entries": len(self._entries), "bytes": self.current_bytes}
+
 
 class FileHandler(ABC):
     """Abstract Base Class for all file handlers"""
     
-    def __init__(self, filename):
+    # Subclasses handling raw bytes set binary = True
+    binary = False
+    encoding = 'utf-8'
+    
+    # Set to True to fsync() after every write made through the descriptor
+    sync_on_write = False
+    # Set to True to make full rewrites atomic: the new contents go to a
+    # temporary file that then replaces the original with os.replace(), so
+    # readers see either the old or the new file, never a partial one
+    atomic_writes = False
+    # Opt-in: assign a ReadCache (on a class or on one handler) to cache reads
+    cache = None
+    
+    def __init__(self, filename, compression=None, compression_level=None):
+        """
+        Args:
+            filename: Path of the file
+            compression: 'gzip', 'bz2' or 'lzma'; None picks the codec from
+                the extension (.gz, .bz2, .xz, .lzma) and False disables it
+            compression_level: Codec level (gzip/bz2 1-9, lzma preset 0-9)
+        """
         self.filename = filename
         self.is_open = False
+        self.fd = None  # OS file descriptor held between open() and close()
+        self._holding_fd = False
+        if compression is None:
+            compression = detect_compression(filename)
+        elif compression is False:
+            compression = None
+        elif compression not in COMPRESSION_CODECS:
+            raise ValueError(f"Unknown compression {compression!r}")
+        self.compression = compression
+        self.compression_level = compression_level
     
     @abstractmethod
     def read(self):
@@ -19,16 +186,331 @@ class FileHandler(ABC):
         """Write data to the file"""
         pass
     
+    def read_iter(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Generator yielding the file contents in pieces of at most chunk_size.
+        
+        Text handlers yield str (the incremental UTF-8 decoder of the text
+        layer keeps multi-byte characters intact across chunk boundaries),
+        binary handlers yield bytes. Only one chunk is in memory at a time.
+        """
+        if not self.is_open:
+            self._mark_open()
+        
+        total = 0
+        try:
+            with self._open_stream(text=not self.binary) as file:
+                while True:
+                    chunk = file.read(chunk_size)
+                    if not chunk:
+                        break
+                    total += len(chunk)
+                    yield chunk
+            unit = "bytes" if self.binary else "characters"
+            print(f"Streamed {total} {unit} from {self.filename}")
+        except FileNotFoundError:
+            print(f"File {self.filename} not found")
+        except Exception as e:
+            print(f"Error streaming {self.filename}: {e}")
+    
+    def _open_stream(self, text):
+        """File object for a streaming read, decompressing on the fly"""
+        mode = 'rt' if text else 'rb'
+        encoding = self.encoding if text else None
+        if self.compression is None:
+            return open(self.filename, mode, encoding=encoding)
+        module = COMPRESSION_CODECS[self.compression][0]
+        return module.open(self.filename, mode, encoding=encoding)
+    
+    def _check_uncompressed(self, operation):
+        if self.compression is not None:
+            raise ValueError(f"{operation} is not supported on {self.compression}-compressed files")
+    
     def open(self):
-        """Common method to mark file as open"""
+        """
+        Open the file and keep its OS file descriptor until close().
+        
+        Between open() and close() (or inside a with block) read() and
+        write() reuse the descriptor instead of reopening the file each
+        time; called without open(), every operation uses a descriptor of
+        its own. Whole-file read() and write() reopen the held descriptor
+        when the path has come to name a different file (replaced by an
+        atomic write, an editor or log rotation); positioned calls such as
+        read_at() skip that check and keep using the descriptor as is.
+        A file that does not exist yet gets its descriptor on the first
+        write.
+        """
+        self._mark_open()
+        self._holding_fd = True
+        self._acquire_fd(create=False)
+    
+    def _mark_open(self):
+        """Mark the file as open without holding a descriptor"""
         self.is_open = True
         print(f"Opened {self.filename}")
     
     def close(self):
-        """Common method to mark file as closed"""
+        """Release the file descriptor and mark the file as closed"""
+        self._holding_fd = False
+        self._release_fd()
         self.is_open = False
         print(f"Closed {self.filename}")
     
+    def _open_fd(self, create):
+        """A new descriptor for the file; read-only if it cannot be written"""
+        flags = os.O_RDWR | getattr(os, 'O_BINARY', 0)
+        if create:
+            flags |= os.O_CREAT
+        try:
+            return os.open(self.filename, flags, 0o666)
+        except PermissionError:
+            return os.open(self.filename, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    
+    def _fd_is_current(self):
+        """Whether the held descriptor still refers to the file at the path"""
+        try:
+            st = os.stat(self.filename)
+        except FileNotFoundError:
+            return False
+        held = os.fstat(self.fd)
+        return (st.st_dev, st.st_ino) == (held.st_dev, held.st_ino)
+    
+    def _acquire_fd(self, create, revalidate=False):
+        # The check costs a stat() and an fstat(), more than a small pread()
+        if revalidate and self.fd is not None and not self._fd_is_current():
+            self._release_fd()
+        if self.fd is None:
+            try:
+                self.fd = self._open_fd(create)
+            except FileNotFoundError:
+                if create:
+                    raise
+        return self.fd
+    
+    def _release_fd(self):
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+    
+    def __del__(self):
+        # Handlers that were never closed must not leak their descriptor
+        if getattr(self, 'fd', None) is not None:
+            self._release_fd()
+    
+    @contextlib.contextmanager
+    def _descriptor(self, create=False, revalidate=False):
+        """
+        Descriptor for one operation: the held one between open() and
+        close(), otherwise a new one that is closed afterwards. Raises
+        FileNotFoundError for a missing file unless create is True.
+        revalidate=True first reopens a held descriptor whose file has
+        been replaced.
+        """
+        if self._holding_fd:
+            fd = self._acquire_fd(create, revalidate)
+            if fd is None:
+                raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), self.filename)
+            yield fd
+            return
+        fd = self._open_fd(create)
+        try:
+            yield fd
+        finally:
+            os.close(fd)
+    
+    def _read_bytes(self):
+        """Whole file contents, through the held descriptor when there is one"""
+        if self.compression is not None:
+            with self._open_stream(text=False) as file:
+                return file.read()
+        if not self._holding_fd:
+            with open(self.filename, 'rb') as file:
+                return file.read()
+        with self._descriptor(revalidate=True) as fd:
+            chunks = [_pread(fd, os.fstat(fd).st_size, 0)]
+            offset = len(chunks[0])
+            while True:  # The file may have grown since fstat()
+                chunk = _pread(fd, DEFAULT_CHUNK_SIZE, offset)
+                if not chunk:
+                    return b"".join(chunks)
+                chunks.append(chunk)
+                offset += len(chunk)
+    
+    def _cache_key(self):
+        return (self.__class__.__name__, os.path.abspath(self.filename))
+    
+    def _stat_stamp(self):
+        # The path, not the held descriptor: the file may have been replaced
+        st = os.stat(self.filename)
+        return (st.st_mtime_ns, st.st_size)
+    
+    def _cached_read(self, parse):
+        """parse(raw bytes of the file), served from self.cache when enabled"""
+        if self.cache is None:
+            return parse(self._read_bytes())
+        key, stamp = self._cache_key(), self._stat_stamp()
+        value = self.cache.get(key, stamp)
+        if value is _MISS:
+            raw = self._read_bytes()
+            value = parse(raw)
+            # Charge the decompressed size: st_size undercounts .gz/.xz files
+            self.cache.put(key, stamp, value, len(raw))
+        return value
+    
+    def _parse(self, raw):
+        """Turn the raw bytes of the file into the value read() returns"""
+        return bytes(raw)
+    
+    def _load(self):
+        """read() without the messages: returns the value or raises"""
+        return self._cached_read(self._parse)
+    
+    @abstractmethod
+    def _store(self, data):
+        """write() without the messages: writes data or raises"""
+        pass
+    
+    def _write_bytes(self, data, append=False, cached_value=_MISS, fsync=False):
+        """
+        Replace (or append to) the file contents through the descriptor.
+        
+        data may also be a list of buffers, written back to back without
+        joining them first. With a cache enabled the entry for this file is refreshed with
+        cached_value when one is given, and invalidated otherwise.
+        fsync=True forces the data to stable storage even without
+        sync_on_write.
+        """
+        fsync = fsync or self.sync_on_write
+        pieces = data if isinstance(data, list) else (data,)
+        if append:
+            # O_APPEND makes the kernel put every write at the current end,
+            # so concurrent appenders never overwrite each other
+            fd = os.open(self.filename, os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, 'O_BINARY', 0), 0o666)
+            try:
+                if self.compression is None and len(pieces) > 1:
+                    pieces = (b"".join(pieces),)  # One write() call, not one per piece
+                self._write_pieces(fd, pieces, None)
+                if fsync:
+                    os.fsync(fd)
+            finally:
+                os.close(fd)
+        elif self.atomic_writes:
+            self._replace_atomically(pieces, fsync)
+        else:
+            with self._descriptor(create=True, revalidate=True) as fd:
+                os.ftruncate(fd, 0)
+                self._write_pieces(fd, pieces, 0)
+                if fsync:
+                    os.fsync(fd)
+        if self.cache is not None:
+            if cached_value is _MISS:
+                self.cache.invalidate(self._cache_key())
+            else:
+                nbytes = sum(memoryview(piece).nbytes for piece in pieces)
+                self.cache.put(self._cache_key(), self._stat_stamp(), cached_value, nbytes)
+    
+    def _write_pieces(self, fd, pieces, offset):
+        """Write pieces to fd at offset (None: at its position), compressing them when enabled"""
+        if self.compression is None:
+            for piece in pieces:
+                piece = memoryview(piece).cast('B')
+                _pwrite_all(fd, piece, offset)
+                if offset is not None:
+                    offset += piece.nbytes
+            return
+        # Appending adds a new compressed member; all three codecs read
+        # concatenated members back as one stream
+        module, _, level_argument = COMPRESSION_CODECS[self.compression]
+        options = {} if self.compression_level is None else {level_argument: self.compression_level}
+        if offset is not None:
+            os.lseek(fd, offset, os.SEEK_SET)
+        with open(fd, 'wb', closefd=False) as raw, module.open(raw, 'wb', **options) as stream:
+            for piece in pieces:
+                stream.write(piece)
+    
+    def _replace_atomically(self, pieces, fsync=False):
+        path = os.path.abspath(self.filename)
+        directory, name = os.path.split(path)
+        # The temporary file must be on the same file system for os.replace().
+        # Not tempfile.mkstemp(): its owner-only 0o600 would end up on the
+        # new file, while 0o666 lets the kernel apply the umask like open()
+        flags = os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, 'O_BINARY', 0)
+        while True:
+            temp_path = os.path.join(directory, f".{name}.{os.urandom(6).hex()}.tmp")
+            try:
+                fd = os.open(temp_path, flags, 0o666)
+                break
+            except FileExistsError:
+                continue
+        try:
+            try:
+                os.chmod(temp_path, stat.S_IMODE(os.stat(path).st_mode))
+            except FileNotFoundError:
+                pass  # A new file keeps the umask-based mode
+            self._write_pieces(fd, pieces, 0)
+            if fsync or self.sync_on_write:
+                os.fsync(fd)
+        except BaseException:
+            os.close(fd)
+            os.remove(temp_path)
+            raise
+        os.close(fd)
+        os.replace(temp_path, path)
+        if self.fd is not None:
+            # The held descriptor still refers to the replaced file
+            self._release_fd()
+            self._acquire_fd(create=False)
+    
+    def read_at(self, offset, size):
+        """Read up to size bytes at byte offset without moving any file position"""
+        if not self.is_open:
+            self._mark_open()
+        
+        try:
+            self._check_uncompressed("read_at()")
+            if self._holding_fd and self.fd is not None:
+                return _pread(self.fd, size, offset)  # Hot path: no context manager
+            with self._descriptor() as fd:
+                return _pread(fd, size, offset)
+        except FileNotFoundError:
+            print(f"File {self.filename} not found")
+            return b""
+        except Exception as e:
+            print(f"Error reading {self.filename}: {e}")
+            return b""
+    
+    def write_at(self, offset, data):
+        """Overwrite bytes at byte offset, extending the file if needed"""
+        if not self.is_open:
+            self._mark_open()
+        
+        try:
+            self._check_uncompressed("write_at()")
+            with self._descriptor(create=True) as fd:
+                _pwrite_all(fd, data, offset)
+                if self.sync_on_write:
+                    os.fsync(fd)
+            if self.cache is not None:
+                self.cache.invalidate(self._cache_key())
+            return True
+        except Exception as e:
+            print(f"Error writing {self.filename}: {e}")
+            return False
+    
+    def flush(self, fsync=False):
+        """
+        Make written data durable.
+        
+        Writes through the descriptor are unbuffered, so they are already
+        visible to other readers; fsync=True additionally forces them to
+        stable storage. Without a held descriptor (appends, or a handler
+        that was never opened) a new one is opened for the fsync; a
+        missing file raises FileNotFoundError.
+        """
+        if fsync:
+            with self._descriptor() as fd:
+                os.fsync(fd)
+    
     def __enter__(self):
         """Context manager support"""
         self.open()
@@ -48,11 +530,10 @@ class TextFileHandler(FileHandler):
     def read(self):
         """Read text file contents"""
         if not self.is_open:
-            self.open()
+            self._mark_open()
         
         try:
-            with open(self.filename, 'r', encoding='utf-8') as file:
-                content = file.read()
+            content = self._load()
             print(f"Read {len(content)} characters from text file")
             return content
         except FileNotFoundError:
@@ -65,29 +546,238 @@ class TextFileHandler(FileHandler):
     def write(self, data):
         """Write data to text file"""
         if not self.is_open:
-            self.open()
+            self._mark_open()
         
         try:
-            with open(self.filename, 'w', encoding='utf-8') as file:
-                file.write(str(data))
-            print(f"Wrote {len(str(data))} characters to text file")
+            length = self._store(data)
+            print(f"Wrote {length} characters to text file")
             return True
         except Exception as e:
             print(f"Error writing to text file: {e}")
             return False
+    
+    def append(self, data):
+        """Append data to the end of the text file"""
+        if not self.is_open:
+            self._mark_open()
+        
+        try:
+            encoded = self._encode(data)
+            self._write_bytes(encoded, append=True)
+            print(f"Appended {len(encoded)} bytes to text file")
+            return True
+        except Exception as e:
+            print(f"Error appending to text file: {e}")
+            return False
+    
+    def _encode(self, data):
+        return str(data).encode(self.encoding)
+    
+    def _store(self, data):
+        text = str(data)
+        encoded = text.encode(self.encoding)
+        # Cache what a read would return, i.e. with newlines translated
+        self._write_bytes(encoded, cached_value=self._parse(encoded))
+        return len(text)
+    
+    def _parse(self, raw):
+        content = bytes(raw).decode(self.encoding)
+        if '\r' in content:
+            # Same universal-newline translation as text mode
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        return content
+    
+    # --- Line-offset index ---
+    #
+    # The sidecar file <filename>.lineidx is an array('Q'): a header of
+    # LINE_INDEX_MAGIC, the indexed file size, its st_mtime_ns and a CRC of
+    # the last bytes covered, followed by the byte offset where each line
+    # starts. When the file has only grown (the CRC still matches) the
+    # index is extended from the old end instead of being rebuilt. The
+    # sidecar is always written to a temporary file that then replaces it,
+    # so a crash or a full disk never leaves a header that vouches for a
+    # short list of offsets, and concurrent readers never see half of one.
+    
+    LINE_INDEX_SUFFIX = '.lineidx'
+    LINE_INDEX_MAGIC = 0x4C494458_00000001
+    LINE_INDEX_TAIL = 4096  # Bytes covered by the tail CRC
+    
+    def _tail_crc(self, fd, size):
+        start = max(0, size - self.LINE_INDEX_TAIL)
+        return zlib.crc32(_pread(fd, size - start, start))
+    
+    def _scan_line_offsets(self, fd, offsets, position, end):
+        """
+        Append the start of every line beginning after position, up to the
+        size recorded in the header: bytes appended to a live file while
+        the scan runs are left for the next extension.
+        """
+        while position < end:
+            chunk = _pread(fd, min(DEFAULT_CHUNK_SIZE, end - position), position)
+            if not chunk:
+                return position
+            parts = chunk.split(b'\n')
+            # Each newline starts a new line one byte later; accumulate()
+            # turns the part lengths into absolute offsets in C
+            starts = accumulate(map((1).__add__, map(len, parts[:-1])), initial=position)
+            next(starts)
+            offsets.extend(starts)
+            position += len(chunk)
+        return position
+    
+    def line_index(self):
+        """
+        Return the array('Q') of line start offsets, building, loading or
+        extending the sidecar index as needed.
+        """
+        self._check_uncompressed("line indexing")
+        if not self.is_open:
+            self._mark_open()
+        with self._descriptor() as fd:
+            return self._line_index_for(fd)
+    
+    def _line_index_for(self, fd):
+        st = os.fstat(fd)
+        cached = getattr(self, '_line_index', None)
+        if cached is not None and cached[0] == (st.st_size, st.st_mtime_ns):
+            return cached[1]
+        
+        index_path = self.filename + self.LINE_INDEX_SUFFIX
+        header, offsets = array('Q'), array('Q')
+        try:
+            with open(index_path, 'rb') as file:
+                header.fromfile(file, 4)
+                offsets.frombytes(file.read())
+        except (FileNotFoundError, EOFError, ValueError):  # ValueError: torn offsets
+            header = None
+        
+        if header is not None and header[0] == self.LINE_INDEX_MAGIC and offsets:
+            _, size, mtime_ns, tail_crc = header
+            if (size, mtime_ns) == (st.st_size, st.st_mtime_ns):
+                self._line_index = ((st.st_size, st.st_mtime_ns), offsets)
+                return offsets
+            if size < st.st_size and self._tail_crc(fd, size) == tail_crc:
+                # The file only grew: scan just the new bytes and append them
+                self._scan_line_offsets(fd, offsets, size, st.st_size)
+                header = array('Q', [self.LINE_INDEX_MAGIC, st.st_size, st.st_mtime_ns,
+                                     self._tail_crc(fd, st.st_size)])
+                self._save_line_index(index_path, header, offsets)
+                self._line_index = ((st.st_size, st.st_mtime_ns), offsets)
+                return offsets
+        
+        # Missing, stale or rewritten: build the index in one streaming pass
+        offsets = array('Q', [0])
+        self._scan_line_offsets(fd, offsets, 0, st.st_size)
+        header = array('Q', [self.LINE_INDEX_MAGIC, st.st_size, st.st_mtime_ns,
+                             self._tail_crc(fd, st.st_size)])
+        self._save_line_index(index_path, header, offsets)
+        self._line_index = ((st.st_size, st.st_mtime_ns), offsets)
+        return offsets
+    
+    @staticmethod
+    def _save_line_index(index_path, header, offsets):
+        """Write the sidecar to a temporary file, then swap it in with os.replace()"""
+        directory, name = os.path.split(os.path.abspath(index_path))
+        temp_path = os.path.join(directory, f".{name}.{os.urandom(6).hex()}.tmp")
+        try:
+            with open(temp_path, 'xb') as file:
+                header.tofile(file)
+                offsets.tofile(file)
+            os.replace(temp_path, index_path)
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(temp_path)
+            raise
+    
+    def line_count(self):
+        offsets = self.line_index()
+        size = self._line_index[0][0]
+        # A trailing newline leaves a final "start" at end of file
+        return len(offsets) - (offsets[-1] == size)
+    
+    def read_lines(self, start, stop=None):
+        """
+        Return lines start..stop-1 (slice semantics, newlines removed),
+        reading only the bytes of those lines.
+        """
+        try:
+            count = self.line_count()
+            start, stop, _ = slice(start, stop).indices(count)
+            if start >= stop:
+                return []
+            offsets = self.line_index()
+            size = self._line_index[0][0]
+            begin = offsets[start]
+            end = offsets[stop] if stop < len(offsets) else size
+            with self._descriptor() as fd:
+                text = _pread(fd, end - begin, begin).decode(self.encoding)
+            if text.endswith('\n'):
+                text = text[:-1]
+            lines = text.split('\n')
+            if '\r' in text:
+                lines = [line[:-1] if line.endswith('\r') else line for line in lines]
+            return lines
+        except FileNotFoundError:
+            print(f"Text file {self.filename} not found")
+            return []
+        except Exception as e:
+            print(f"Error reading lines: {e}")
+            return []
+
+
+def _record_fields(record_format):
+    """
+    (type code, byte offset) of every field of a struct format, skipping
+    pad bytes; offsets include the alignment padding of native formats.
+    """
+    prefix = record_format[0] if record_format[:1] in ('@', '=', '<', '>', '!') else ''
+    body = record_format[len(prefix):].replace(' ', '')
+    fields, layout, count = [], prefix, ''
+    for char in body:
+        if char.isdigit():
+            count += char
+            continue
+        repeat = int(count or 1)
+        count = ''
+        if char in 'sp':
+            layout += f"{repeat}{char}"
+            fields.append((char, struct.calcsize(layout) - repeat))
+            continue
+        for _ in range(repeat):
+            layout += char
+            if char != 'x':
+                fields.append((char, struct.calcsize(layout) - struct.calcsize(prefix + char)))
+    return fields
 
 
 class BinaryFileHandler(FileHandler):
-    """Concrete class for handling binary files"""
+    """
+    Concrete class for handling binary files
+    
+    Passing record_format (a struct format such as '<qdd') switches on a
+    record mode on top of the byte-blob API: the file is a plain sequence
+    of fixed-width packed records. append_records() packs and appends them
+    in bulk, record(i) unpacks record i straight from a memory map in O(1),
+    and column() returns one field of every record as a zero-copy strided
+    memoryview. record_fields optionally names the fields.
+    """
+    
+    binary = True
+    
+    def __init__(self, filename, record_format=None, record_fields=None, **compression_options):
+        super().__init__(filename, **compression_options)
+        self.record_struct = struct.Struct(record_format) if record_format else None
+        self.record_fields = tuple(record_fields) if record_fields else None
+        self._record_map = None  # ((st_dev, st_ino, size), memoryview of the mapped file)
+        self._maps = weakref.WeakSet()  # Every mmap handed out through a view
     
     def read(self):
         """Read binary file contents"""
         if not self.is_open:
-            self.open()
+            self._mark_open()
         
         try:
-            with open(self.filename, 'rb') as file:
-                content = file.read()
+            content = self._load()
             print(f"Read {len(content)} bytes from binary file")
             return content
         except FileNotFoundError:
@@ -100,58 +790,1089 @@ class BinaryFileHandler(FileHandler):
     def write(self, data):
         """Write data to binary file"""
         if not self.is_open:
-            self.open()
+            self._mark_open()
         
         try:
-            with open(self.filename, 'wb') as file:
-                if isinstance(data, (bytes, bytearray)):
-                    file.write(data)
-                else:
-                    # Convert to bytes if not already
-                    file.write(str(data).encode('utf-8'))
+            self._store(data)
             print(f"Wrote data to binary file")
             return True
         except Exception as e:
             print(f"Error writing to binary file: {e}")
             return False
+    
+    def append(self, data):
+        """Append data to the end of the binary file"""
+        if not self.is_open:
+            self._mark_open()
+        
+        try:
+            self._write_bytes(self._encode(data), append=True)
+            print(f"Appended data to binary file")
+            return True
+        except Exception as e:
+            print(f"Error appending to binary file: {e}")
+            return False
+    
+    def _encode(self, data):
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            return data
+        # Convert to bytes if not already
+        return str(data).encode('utf-8')
+    
+    def _store(self, data):
+        encoded = self._encode(data)
+        if isinstance(encoded, bytes):
+            self._write_bytes(encoded, cached_value=encoded)
+        else:
+            self._write_bytes(encoded)
+    
+    def _write_bytes(self, data, append=False, cached_value=_MISS, fsync=False):
+        if not append and not self.atomic_writes:
+            self._unmap_before_truncate()
+        super()._write_bytes(data, append, cached_value, fsync)
+    
+    def _unmap_before_truncate(self):
+        """
+        Close the maps behind read_view() and record mode before the file
+        is truncated in place: touching a mapped page past the new end of
+        file kills the process with SIGBUS. A map still used by a live view
+        cannot be closed, so the write is refused instead.
+        """
+        self._record_map = None
+        for mapped in list(self._maps):
+            try:
+                mapped.close()
+            except BufferError:
+                raise BufferError(f"{self.filename} is still mapped by views from read_view(), "
+                                  f"column() or iter_records(); release them or set atomic_writes") from None
+    
+    def read_view(self):
+        """
+        Return a read-only memoryview over a memory map of the file.
+        
+        Nothing is copied: pages are loaded by the OS on first access, so
+        slicing a multi-GB file is cheap. The map stays alive as long as the
+        view does; call view.release() to unmap it early.
+        """
+        if not self.is_open:
+            self._mark_open()
+        
+        try:
+            self._check_uncompressed("read_view()")
+            with open(self.filename, 'rb') as file:
+                if os.fstat(file.fileno()).st_size == 0:
+                    return memoryview(b"")  # mmap cannot map an empty file
+                mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._maps.add(mapped)
+            return memoryview(mapped)
+        except FileNotFoundError:
+            print(f"Binary file {self.filename} not found")
+            return memoryview(b"")
+        except Exception as e:
+            print(f"Error mapping binary file: {e}")
+            return memoryview(b"")
+    
+    # --- Fixed-width record mode ---
+    
+    def _require_records(self):
+        if self.record_struct is None:
+            raise ValueError(f"{self} was created without a record_format")
+        self._check_uncompressed("record mode")
+    
+    def _mapped_records(self):
+        """memoryview over the whole records of the file, remapped after growth"""
+        if not self.is_open:
+            self._mark_open()
+        with self._descriptor() as fd:
+            st = os.fstat(fd)
+            # Remap when the file grew or the path now names another file
+            key = (st.st_dev, st.st_ino, st.st_size)
+            if self._record_map is None or self._record_map[0] != key:
+                usable = st.st_size - st.st_size % self.record_struct.size
+                if usable == 0:
+                    view = memoryview(b"")
+                else:
+                    # Views handed out earlier keep the previous map alive
+                    mapped = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+                    self._maps.add(mapped)
+                    view = memoryview(mapped)[:usable]
+                self._record_map = (key, view)
+        return self._record_map[1]
+    
+    def append_records(self, records):
+        """Pack an iterable of tuples and append them with one write"""
+        self._require_records()
+        if not self.is_open:
+            self._mark_open()
+        
+        records = records if isinstance(records, list) else list(records)
+        size = self.record_struct.size
+        buffer = bytearray(size * len(records))
+        pack_into = self.record_struct.pack_into
+        for position, record in zip(range(0, len(buffer), size), records):
+            pack_into(buffer, position, *record)
+        self._write_bytes(buffer, append=True)
+        return len(records)
+    
+    def record_count(self):
+        self._require_records()
+        return len(self._mapped_records()) // self.record_struct.size
+    
+    def record(self, index):
+        """Record index as a tuple, unpacked directly from the memory map"""
+        self._require_records()
+        view = self._mapped_records()
+        count = len(view) // self.record_struct.size
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("record index out of range")
+        return self.record_struct.unpack_from(view, index * self.record_struct.size)
+    
+    def iter_records(self):
+        """Generator of record tuples (materializes one tuple per record)"""
+        self._require_records()
+        return self.record_struct.iter_unpack(self._mapped_records())
+    
+    def column(self, field):
+        """
+        Every record's value of one field as a zero-copy memoryview.
+        
+        The mapped file is cast to the field's type and sliced with the
+        record width as step, so nothing is copied. This needs the native
+        byte order and field size ('<q' and '<d' are fine, '<l' is not on
+        platforms with 8-byte longs), and the record size and field offset
+        must be multiples of the field size (add 'x' pad bytes to the format
+        if they are not).
+        """
+        self._require_records()
+        if isinstance(field, str):
+            if not self.record_fields or field not in self.record_fields:
+                raise KeyError(field)
+            field = self.record_fields.index(field)
+        code, offset = _record_fields(self.record_struct.format)[field]
+        order = self.record_struct.format[:1]
+        if order not in ('@', '=', '<', '>', '!'):
+            order = ''
+        if code in 'spx?' or (order in ('<', '>', '!')
+                              and {'<': 'little', '>': 'big', '!': 'big'}[order] != sys.byteorder):
+            raise ValueError(f"field {field} ({code!r}) cannot be viewed in place")
+        itemsize = struct.calcsize(code)
+        # memoryview.cast() uses native sizes; standard-size formats ('<l' is
+        # 4 bytes, native 'l' is often 8) only work where the two agree
+        if struct.calcsize(order + code) != itemsize:
+            raise ValueError(f"field {field} ({code!r}) has a different size in {order!r} "
+                             f"than natively and cannot be viewed in place")
+        if self.record_struct.size % itemsize or offset % itemsize:
+            raise ValueError(f"field {field} is not aligned to its size; pad the record format")
+        view = self._mapped_records()
+        if not view:
+            return memoryview(array(code))
+        return view.cast(code)[offset // itemsize::self.record_struct.size // itemsize]
 
 
 class JSONFileHandler(FileHandler):
-    """Concrete class for handling JSON files"""
+    """
+    Concrete class for handling JSON files
+    
+    With lines=True the file is JSON Lines (one compact document per line):
+    records can then be streamed with iter_records() and new records are
+    appended without rewriting the file. lines defaults to True for .jsonl
+    and .ndjson files. compact=True drops the indentation and the spaces
+    after separators.
+    """
+    
+    def __init__(self, filename, lines=None, compact=False, **compression_options):
+        super().__init__(filename, **compression_options)
+        if lines is None:
+            name = filename
+            if self.compression is not None and detect_compression(filename):
+                name = os.path.splitext(filename)[0]  # events.jsonl.gz -> events.jsonl
+            lines = name.endswith(('.jsonl', '.ndjson'))
+        self.lines = lines
+        self.compact = compact
+        separators = (',', ':') if compact else None
+        # JSON Lines documents must fit on one line, so they never indent
+        self._indent = None if compact or lines else 2
+        self._line_encoder = json.JSONEncoder(separators=separators)
+        self._separators = separators
     
     def read(self):
-        """Read and parse JSON file"""
+        """
+        Read and parse JSON file (a list of records in JSON Lines mode,
+        skipping invalid lines like iter_records() does)
+        """
         if not self.is_open:
-            self.open()
+            self._mark_open()
         
+        empty = [] if self.lines else {}
         try:
-            with open(self.filename, 'r', encoding='utf-8') as file:
-                content = json.load(file)
+            content = self._load()
             print(f"Read JSON data from {self.filename}")
             return content
         except FileNotFoundError:
             print(f"JSON file {self.filename} not found")
-            return {}
+            return empty
         except json.JSONDecodeError:
             print(f"Invalid JSON in {self.filename}")
-            return {}
+            return empty
         except Exception as e:
             print(f"Error reading JSON file: {e}")
-            return {}
+            return empty
     
     def write(self, data):
-        """Write data as JSON to file"""
+        """Write data as JSON to file (an iterable of records in JSON Lines mode)"""
         if not self.is_open:
-            self.open()
+            self._mark_open()
         
         try:
-            with open(self.filename, 'w', encoding='utf-8') as file:
-                json.dump(data, file, indent=2)
+            self._store(data)
             print(f"Wrote JSON data to {self.filename}")
             return True
         except Exception as e:
             print(f"Error writing JSON file: {e}")
             return False
+    
+    def _cache_key(self):
+        return super()._cache_key() + (self.lines,)
+    
+    def _parse(self, raw):
+        return _parse_json(raw, self.lines, self.filename)
+    
+    def _store(self, data):
+        if self.lines:
+            text = self._encode_lines(data)[0]
+        else:
+            text = json.dumps(data, indent=self._indent, separators=self._separators)
+        self._write_bytes(text.encode('utf-8'))
+    
+    def _encode_lines(self, records):
+        """JSON Lines text for records, and the number of records"""
+        if isinstance(records, Mapping):
+            # Iterating a dict would write its keys as records
+            raise TypeError("JSON Lines mode expects an iterable of records, not a single mapping; "
+                            "wrap it in a list or use append()")
+        encode = self._line_encoder.encode
+        lines = [encode(record) + '\n' for record in records]
+        return ''.join(lines), len(lines)
+    
+    def iter_records(self):
+        """
+        Generator yielding one record at a time.
+        
+        In JSON Lines mode the file is parsed line by line, so memory use
+        does not grow with the file; invalid lines are reported and skipped.
+        A regular JSON document yields the items of a top-level list, or the
+        document itself.
+        """
+        if not self.lines:
+            content = self.read()
+            if isinstance(content, list):
+                yield from content
+            else:
+                yield content
+            return
+        
+        if not self.is_open:
+            self._mark_open()
+        
+        decode = json.JSONDecoder().decode
+        try:
+            with self._open_stream(text=True) as file:
+                for line_number, line in enumerate(file, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        yield decode(line)
+                    except json.JSONDecodeError:
+                        print(f"Invalid JSON on line {line_number} of {self.filename}")
+        except FileNotFoundError:
+            print(f"JSON file {self.filename} not found")
+        except Exception as e:
+            print(f"Error reading JSON file: {e}")
+    
+    def append(self, record):
+        """Append one record to a JSON Lines file"""
+        return self.append_many((record,))
+    
+    def append_many(self, records):
+        """Append records to a JSON Lines file, writing only the new lines"""
+        if not self.lines:
+            print(f"Cannot append to {self.filename}: not in JSON Lines mode")
+            return False
+        
+        if not self.is_open:
+            self._mark_open()
+        
+        try:
+            text, count = self._encode_lines(records)
+            self._write_bytes(text.encode('utf-8'), append=True)
+            print(f"Appended {count} records to {self.filename}")
+            return True
+        except Exception as e:
+            print(f"Error appending to JSON file: {e}")
+            return False
+
+
+class PickleFileHandler(FileHandler):
+    """
+    Concrete class for handling arbitrary Python objects with pickle.
+    
+    Objects are written with pickle protocol 5. Buffers of at least
+    out_of_band_threshold bytes that support out-of-band pickling (NumPy
+    arrays and pickle.PickleBuffer wrappers) are stored after the pickle
+    stream instead of inside it. bytes, bytearray and array.array are
+    always pickled in-band, so callers must wrap large ones in
+    pickle.PickleBuffer themselves; without NumPy such a wrapper comes
+    back as a bare memoryview, not as the original type. read() memory-maps
+    the file and hands the out-of-band buffers back as memoryviews over the
+    map, so large payloads are never copied. write() always swaps in a new file rather than
+    overwriting the mapped one, so those views stay valid. Only read pickle
+    files you trust.
+    
+    File layout: MAGIC, header (pickle length, buffer count), one
+    (offset, length) pair per buffer, the pickle stream, then the buffers,
+    each aligned to BUFFER_ALIGNMENT bytes.
+    """
+    
+    binary = True
+    MAGIC = b"PKL5"
+    HEADER = struct.Struct("<QI")
+    BUFFER_ENTRY = struct.Struct("<QQ")
+    BUFFER_ALIGNMENT = 64
+    
+    def __init__(self, filename, out_of_band_threshold=64 * 1024, **compression_options):
+        super().__init__(filename, **compression_options)
+        self.out_of_band_threshold = out_of_band_threshold
+    
+    def read(self):
+        """Load the object; out-of-band buffers come back as memoryviews"""
+        if not self.is_open:
+            self._mark_open()
+        
+        try:
+            content = self._load()
+            print(f"Read pickled {type(content).__name__} from {self.filename}")
+            return content
+        except FileNotFoundError:
+            print(f"Pickle file {self.filename} not found")
+            return None
+        except Exception as e:
+            print(f"Error reading pickle file: {e}")
+            return None
+    
+    def write(self, data):
+        """Pickle data, moving large buffers out of band"""
+        if not self.is_open:
+            self._mark_open()
+        
+        try:
+            count = self._store(data)
+            print(f"Wrote pickle data to {self.filename} ({count} out-of-band buffers)")
+            return True
+        except Exception as e:
+            print(f"Error writing pickle file: {e}")
+            return False
+    
+    def _load(self):
+        if self.compression is not None:
+            # Compressed buffers have to be decompressed into memory anyway
+            return self._parse(self._read_bytes())
+        # Map the file instead of reading it so buffers can point into it
+        with open(self.filename, 'rb') as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                raise ValueError("empty file")
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._parse(memoryview(mapped))
+    
+    def _parse(self, raw):
+        view = memoryview(raw)
+        if view[:len(self.MAGIC)] != self.MAGIC:
+            raise ValueError("not a PickleFileHandler file")
+        position = len(self.MAGIC)
+        pickle_length, count = self.HEADER.unpack_from(view, position)
+        position += self.HEADER.size
+        buffers = []
+        for _ in range(count):
+            offset, length = self.BUFFER_ENTRY.unpack_from(view, position)
+            position += self.BUFFER_ENTRY.size
+            buffers.append(view[offset:offset + length])
+        return pickle.loads(view[position:position + pickle_length], buffers=buffers)
+    
+    def _store(self, data):
+        buffers = []
+        
+        def keep_large_out_of_band(buffer):
+            # A true return value means "serialize this buffer in-band"
+            if buffer.raw().nbytes < self.out_of_band_threshold:
+                return True
+            buffers.append(buffer.raw())
+            return False
+        
+        stream = pickle.dumps(data, protocol=5, buffer_callback=keep_large_out_of_band)
+        header_size = (len(self.MAGIC) + self.HEADER.size
+                       + self.BUFFER_ENTRY.size * len(buffers))
+        pieces = [self.MAGIC, self.HEADER.pack(len(stream), len(buffers)), None, stream]
+        entries = []
+        offset = header_size + len(stream)
+        for buffer in buffers:
+            padding = -offset % self.BUFFER_ALIGNMENT
+            if padding:
+                pieces.append(bytes(padding))
+                offset += padding
+            entries.append(self.BUFFER_ENTRY.pack(offset, buffer.nbytes))
+            pieces.append(buffer)
+            offset += buffer.nbytes
+        pieces[2] = b"".join(entries)
+        # Always write a new file and swap it in: buffers returned by an
+        # earlier read() map the old file, and truncating that in place
+        # would make touching them crash the process with SIGBUS
+        self._replace_atomically(pieces)
+        if self.cache is not None:
+            self.cache.invalidate(self._cache_key())
+        return len(buffers)
+
+
+class BufferedFileWriter:
+    """
+    Batches many small appends to a TextFileHandler or BinaryFileHandler.
+    
+    write() only adds to an in-memory buffer; the buffer is appended to the
+    file in one system call once it holds max_bytes, or once the oldest
+    pending write is max_delay seconds old. With background=True a
+    write-behind thread performs the time-based flushes, so data reaches
+    the file within max_delay even if no further writes arrive.
+    rewrite() replaces the whole file atomically.
+    """
+    
+    def __init__(self, handler, max_bytes=64 * 1024, max_delay=1.0, background=False):
+        self.handler = handler
+        self.max_bytes = max_bytes
+        self.max_delay = max_delay
+        self._pending = []
+        self._pending_bytes = 0
+        self._oldest = None     # time.monotonic() of the oldest pending write
+        self._lock = threading.Condition()
+        self._closed = False
+        self._thread = None
+        if background:
+            self._thread = threading.Thread(target=self._write_behind, daemon=True,
+                                            name=f"write-behind {handler.filename}")
+            self._thread.start()
+    
+    def write(self, data):
+        """Buffer data; flushes when a size or time threshold is reached"""
+        encoded = self.handler._encode(data)
+        with self._lock:
+            if self._closed:
+                raise ValueError("write to closed BufferedFileWriter")
+            self._pending.append(encoded)
+            self._pending_bytes += len(encoded)
+            if self._oldest is None:
+                self._oldest = time.monotonic()
+                self._lock.notify()  # Start the write-behind countdown
+            if (self._pending_bytes >= self.max_bytes
+                    or (self._thread is None and time.monotonic() - self._oldest >= self.max_delay)):
+                self._flush_locked()
+    
+    def flush(self, fsync=False):
+        """
+        Append everything buffered so far to the file; fsync=True also
+        forces it, and the batches appended before, to stable storage
+        """
+        with self._lock:
+            if self._pending:
+                # fsync() of the append descriptor covers the whole file
+                self._flush_locked(fsync)
+            elif fsync:
+                self.handler.flush(fsync=True)
+    
+    def _flush_locked(self, fsync=False):
+        if self._pending:
+            pending, self._pending = self._pending, []
+            self._pending_bytes = 0
+            self._oldest = None
+            self.handler._write_bytes(pending, append=True, fsync=fsync)
+    
+    def rewrite(self, data):
+        """Atomically replace the file contents (pending writes are dropped)"""
+        encoded = self.handler._encode(data)
+        with self._lock:
+            self._pending, self._pending_bytes, self._oldest = [], 0, None
+            # Replace directly rather than flipping the handler's shared
+            # atomic_writes flag, which other threads would see
+            self.handler._replace_atomically((encoded,))
+            if self.handler.cache is not None:
+                self.handler.cache.invalidate(self.handler._cache_key())
+    
+    def _write_behind(self):
+        with self._lock:
+            while not self._closed:
+                if self._oldest is None:
+                    self._lock.wait()
+                    continue
+                remaining = self._oldest + self.max_delay - time.monotonic()
+                if remaining > 0:
+                    self._lock.wait(remaining)
+                else:
+                    try:
+                        self._flush_locked()
+                    except Exception as e:
+                        print(f"Write-behind flush of {self.handler.filename} failed: {e}")
+                        self._pending, self._pending_bytes, self._oldest = [], 0, None
+    
+    def close(self):
+        """Flush pending data and stop the write-behind thread"""
+        with self._lock:
+            self._closed = True
+            self._lock.notify()
+        if self._thread is not None:
+            self._thread.join()
+        with self._lock:
+            self._flush_locked()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def _parse_json(raw, lines, filename=None):
+    """
+    Parse a JSON document, or JSON Lines into a list of records. Invalid
+    lines are reported and skipped, as in JSONFileHandler.iter_records().
+    """
+    if not lines:
+        return json.loads(raw)
+    decode = json.JSONDecoder().decode
+    text = bytes(raw).decode('utf-8')
+    if '\r' in text:
+        # Same line endings as the text-mode stream iter_records() reads
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    records = []
+    # Split on '\n' only: splitlines() would also break JSON strings
+    # holding a raw U+2028, U+0085 or similar line separator
+    for line_number, line in enumerate(text.split('\n'), 1):
+        if not line.strip():
+            continue
+        try:
+            records.append(decode(line))
+        except json.JSONDecodeError:
+            print(f"Invalid JSON on line {line_number} of {filename}")
+    return records
+
+
+# Outcome of one file in read_many() / write_many(); error is None on success
+BulkResult = namedtuple('BulkResult', ['filename', 'value', 'error'])
+
+
+def read_many(handlers, max_workers=None, parse_in_processes=False, process_workers=None):
+    """
+    Read many files concurrently on a bounded thread pool.
+    
+    Args:
+        handlers: FileHandler instances to read
+        max_workers: Size of the I/O thread pool (default: up to 32)
+        parse_in_processes: Parse JSON in a process pool instead of the
+            I/O threads, for large documents whose parsing is CPU bound
+        process_workers: Size of that process pool (default: CPU count)
+    
+    Returns:
+        list: One BulkResult per handler, in input order
+    """
+    handlers = list(handlers)
+    if not handlers:
+        return []
+    offload = [parse_in_processes and isinstance(handler, JSONFileHandler)
+               for handler in handlers]
+    results = [None] * len(handlers)
+    raw_for_processes = {}
+    
+    with ThreadPoolExecutor(max_workers=max_workers or min(32, len(handlers))) as threads:
+        futures = [threads.submit(handler._read_bytes if offloaded else handler._load)
+                   for handler, offloaded in zip(handlers, offload)]
+        for index, (handler, future) in enumerate(zip(handlers, futures)):
+            try:
+                value = future.result()
+            except Exception as e:
+                results[index] = BulkResult(handler.filename, None, e)
+                continue
+            if offload[index]:
+                raw_for_processes[index] = value
+            else:
+                results[index] = BulkResult(handler.filename, value, None)
+    
+    if raw_for_processes:
+        with ProcessPoolExecutor(max_workers=process_workers) as processes:
+            futures = {index: processes.submit(_parse_json, raw, handlers[index].lines,
+                                                 handlers[index].filename)
+                       for index, raw in raw_for_processes.items()}
+            for index, future in futures.items():
+                try:
+                    results[index] = BulkResult(handlers[index].filename, future.result(), None)
+                except Exception as e:
+                    results[index] = BulkResult(handlers[index].filename, None, e)
+    return results
+
+
+def write_many(pairs, max_workers=None):
+    """
+    Write many files concurrently on a bounded thread pool.
+    
+    Args:
+        pairs: (handler, data) tuples
+        max_workers: Size of the thread pool (default: up to 32)
+    
+    Returns:
+        list: One BulkResult per pair (value True on success), in input order
+    """
+    pairs = list(pairs)
+    if not pairs:
+        return []
+    
+    def store(handler, data):
+        handler._store(data)
+        return True
+    
+    results = []
+    with ThreadPoolExecutor(max_workers=max_workers or min(32, len(pairs))) as threads:
+        futures = [threads.submit(store, handler, data) for handler, data in pairs]
+        for (handler, _), future in zip(pairs, futures):
+            try:
+                results.append(BulkResult(handler.filename, future.result(), None))
+            except Exception as e:
+                results.append(BulkResult(handler.filename, None, e))
+    return results
+
+
+# --- asyncio support ---
+
+ASYNC_MAX_WORKERS = 4       # Threads doing blocking I/O for the async handlers
+ASYNC_MAX_IN_FLIGHT = 64    # Operations allowed to wait for those threads per loop
+
+_async_executor = None
+_async_executor_lock = threading.Lock()
+_async_limits = weakref.WeakKeyDictionary()  # event loop -> Semaphore
+
+
+def _get_async_executor():
+    global _async_executor
+    with _async_executor_lock:
+        if _async_executor is None:
+            _async_executor = ThreadPoolExecutor(max_workers=ASYNC_MAX_WORKERS,
+                                                 thread_name_prefix="async-file-io")
+        return _async_executor
+
+
+class AsyncFileHandler:
+    """
+    Base class for the asyncio file handlers.
+    
+    Each async handler wraps the matching blocking handler and runs its
+    operations on a dedicated, bounded thread pool, so the event loop never
+    blocks on disk I/O. At most ASYNC_MAX_IN_FLIGHT operations per event
+    loop are handed to the pool at once; the rest wait on a semaphore
+    instead of piling up in the executor queue. Operations on the same
+    handler run one at a time, since they share its file descriptor.
+    """
+    
+    handler_class = None  # Set by subclasses
+    
+    def __init__(self, filename, *args, **kwargs):
+        self.filename = filename
+        self.handler = self.handler_class(filename, *args, **kwargs)
+        self._locks = weakref.WeakKeyDictionary()  # event loop -> Lock for this handler
+    
+    async def _run(self, func, *args):
+        loop = asyncio.get_running_loop()
+        limit = _async_limits.get(loop)
+        if limit is None:
+            limit = _async_limits[loop] = asyncio.Semaphore(ASYNC_MAX_IN_FLIGHT)
+        lock = self._locks.get(loop)
+        if lock is None:
+            lock = self._locks[loop] = asyncio.Lock()
+        # Take the handler's lock first so waiting for it does not hold a pool slot
+        async with lock:
+            async with limit:
+                return await loop.run_in_executor(_get_async_executor(), func, *args)
+    
+    async def read(self):
+        """Awaitable version of read()"""
+        return await self._run(self.handler.read)
+    
+    async def write(self, data):
+        """Awaitable version of write()"""
+        return await self._run(self.handler.write, data)
+    
+    async def read_iter(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Async generator version of read_iter(); each chunk is read off-loop"""
+        chunks = self.handler.read_iter(chunk_size)
+        while True:
+            chunk = await self._run(next, chunks, None)
+            if chunk is None:
+                return
+            yield chunk
+    
+    async def open(self):
+        await self._run(self.handler.open)
+    
+    async def close(self):
+        await self._run(self.handler.close)
+    
+    async def __aenter__(self):
+        """Async context manager support"""
+        await self.open()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager support"""
+        await self.close()
+    
+    def __str__(self):
+        return f"{self.__class__.__name__}({self.filename})"
+
+
+class AsyncTextFileHandler(AsyncFileHandler):
+    handler_class = TextFileHandler
+
+
+class AsyncBinaryFileHandler(AsyncFileHandler):
+    handler_class = BinaryFileHandler
+
+
+class AsyncJSONFileHandler(AsyncFileHandler):
+    handler_class = JSONFileHandler
+
+
+def benchmark_reads(filename="benchmark_read.bin", size=64 * 1024 * 1024):
+    """
+    Compare the full read() path with read_iter() and read_view().
+    
+    Peak memory is the tracemalloc peak of Python allocations (mmap pages
+    belong to the page cache, not to the Python heap).
+    """
+    with open(filename, 'wb') as file:
+        block = os.urandom(1024 * 1024)
+        for _ in range(size // len(block)):
+            file.write(block)
+    
+    handler = BinaryFileHandler(filename)
+    
+    def full_read():
+        return len(handler.read())
+    
+    def chunked_read():
+        return sum(len(chunk) for chunk in handler.read_iter())
+    
+    def mapped_read():
+        view = handler.read_view()
+        # Touch one byte per page so the data really is faulted in
+        for offset in range(0, len(view), mmap.PAGESIZE):
+            view[offset]
+        total = view.nbytes
+        view.release()
+        return total
+    
+    print(f"Reading {size // (1024 * 1024)} MiB:")
+    try:
+        for name, func in [("read()", full_read), ("read_iter()", chunked_read),
+                           ("read_view()", mapped_read)]:
+            tracemalloc.start()
+            start = time.perf_counter()
+            nbytes = func()
+            elapsed = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"  {name:12} {nbytes / elapsed / 1e6:9.1f} MB/s   peak {peak / 1e6:8.2f} MB")
+    finally:
+        os.remove(filename)
+
+
+def benchmark_small_reads(filename="benchmark_small.bin", count=10_000, size=64):
+    """Many small reads: reopening the file each time vs one held descriptor"""
+    with open(filename, 'wb') as file:
+        file.write(os.urandom(count * size))
+    
+    try:
+        start = time.perf_counter()
+        for i in range(count):
+            with open(filename, 'rb') as file:
+                file.seek(i * size)
+                file.read(size)
+        reopen_time = time.perf_counter() - start
+        
+        with BinaryFileHandler(filename) as handler:
+            start = time.perf_counter()
+            for i in range(count):
+                handler.read_at(i * size, size)
+            held_time = time.perf_counter() - start
+    finally:
+        os.remove(filename)
+    
+    print(f"{count:,} reads of {size} bytes:")
+    print(f"  open() per read:   {reopen_time / count * 1e6:7.2f} us/read")
+    print(f"  held descriptor:   {held_time / count * 1e6:7.2f} us/read")
+    return reopen_time, held_time
+
+
+def benchmark_pickle_vs_json(count=2_000_000):
+    """Write and read a large float payload with PickleFileHandler and JSONFileHandler"""
+    values = array('d', (i * 0.5 for i in range(count)))
+    results = {}
+    for name, handler, payload in [
+        ("JSONFileHandler", JSONFileHandler("benchmark.json", compact=True),
+         {"values": values.tolist()}),
+        ("PickleFileHandler", PickleFileHandler("benchmark.pkl"),
+         {"values": pickle.PickleBuffer(values)}),
+    ]:
+        try:
+            start = time.perf_counter()
+            handler.write(payload)
+            write_time = time.perf_counter() - start
+            start = time.perf_counter()
+            loaded = handler.read()["values"]
+            if isinstance(loaded, memoryview):
+                loaded = loaded.cast('d')  # Still zero-copy
+            checksum = loaded[count - 1]
+            read_time = time.perf_counter() - start
+            size = os.path.getsize(handler.filename)
+            handler.close()
+        finally:
+            os.remove(handler.filename)
+        results[name] = (write_time, read_time, size)
+        print(f"  {name:18} write {write_time * 1000:8.1f} ms   read {read_time * 1000:8.1f} ms"
+              f"   {size / 1e6:7.1f} MB   last={checksum}")
+    return results
+
+
+def benchmark_bulk_reads(directory="bulk_benchmark", count=2_000):
+    """Throughput of read_many() against a sequential loop over small JSON files"""
+    os.makedirs(directory, exist_ok=True)
+    handlers = [JSONFileHandler(os.path.join(directory, f"record{i}.json"), compact=True)
+                for i in range(count)]
+    try:
+        write_many((handler, {"id": i, "values": list(range(20))})
+                   for i, handler in enumerate(handlers))
+        
+        start = time.perf_counter()
+        sequential = [handler._load() for handler in handlers]
+        sequential_time = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        concurrent = read_many(handlers, max_workers=16)
+        concurrent_time = time.perf_counter() - start
+        
+        assert [result.value for result in concurrent] == sequential
+    finally:
+        for handler in handlers:
+            if os.path.exists(handler.filename):
+                os.remove(handler.filename)
+        os.rmdir(directory)
+    
+    print(f"Reading {count:,} small JSON files:")
+    print(f"  sequential loop: {count / sequential_time:10,.0f} files/s")
+    print(f"  read_many():     {count / concurrent_time:10,.0f} files/s")
+    return sequential_time, concurrent_time
+
+
+def benchmark_loop_latency(filename="latency_benchmark.bin", size=32 * 1024 * 1024, reads=16):
+    """
+    Worst event-loop lag while many large reads run, blocking vs async.
+    
+    A heartbeat task sleeps 1 ms at a time and records how late it wakes up.
+    """
+    with open(filename, 'wb') as file:
+        file.write(os.urandom(size))
+    
+    async def measure(load):
+        lags = []
+        done = False
+        
+        async def heartbeat():
+            loop = asyncio.get_running_loop()
+            while not done:
+                start = loop.time()
+                await asyncio.sleep(0.001)
+                lags.append(loop.time() - start - 0.001)
+        
+        ticker = asyncio.create_task(heartbeat())
+        await asyncio.sleep(0.01)
+        await load()
+        done = True
+        await ticker
+        return max(lags)
+    
+    async def blocking_reads():
+        for _ in range(reads):
+            BinaryFileHandler(filename).read()
+            await asyncio.sleep(0)
+    
+    async def async_reads():
+        await asyncio.gather(*(AsyncBinaryFileHandler(filename).read() for _ in range(reads)))
+    
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            blocking_lag = asyncio.run(measure(blocking_reads))
+            async_lag = asyncio.run(measure(async_reads))
+    finally:
+        os.remove(filename)
+    
+    print(f"Worst event-loop lag during {reads} reads of {size // (1024 * 1024)} MiB:")
+    print(f"  blocking handler: {blocking_lag * 1000:7.2f} ms")
+    print(f"  async handler:    {async_lag * 1000:7.2f} ms")
+    return blocking_lag, async_lag
+
+
+def benchmark_tiny_writes(filename="tiny_writes.log", count=20_000, rewrite_count=2_000):
+    """Many tiny writes: rewrite per write, append per write, BufferedFileWriter"""
+    line = "2024-01-01 12:00:00 INFO request handled\n"
+    handler = TextFileHandler(filename)
+    results = {}
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            # The original API can only keep a log by rewriting everything
+            content = []
+            start = time.perf_counter()
+            for _ in range(rewrite_count):
+                content.append(line)
+                handler.write("".join(content))
+            results["rewrite per write"] = (time.perf_counter() - start) / rewrite_count
+            
+            handler.write("")
+            start = time.perf_counter()
+            for _ in range(count):
+                handler.append(line)
+            results["append per write"] = (time.perf_counter() - start) / count
+            
+            handler.write("")
+            start = time.perf_counter()
+            with BufferedFileWriter(handler) as writer:
+                for _ in range(count):
+                    writer.write(line)
+            results["BufferedFileWriter"] = (time.perf_counter() - start) / count
+            handler.close()
+    finally:
+        os.remove(filename)
+    
+    print("Tiny writes:")
+    for name, per_write in results.items():
+        print(f"  {name:20} {per_write * 1e6:9.2f} us/write")
+    return results
+
+
+def benchmark_compression(basename="compression_benchmark.jsonl", records=100_000, level=None):
+    """Wall time and bytes on disk for each codec on a compressible JSON Lines file"""
+    payload = [{"id": i, "event": "page_view", "path": f"/articles/{i % 500}", "ok": True}
+               for i in range(records)]
+    results = {}
+    print(f"{records:,} JSON Lines records:")
+    for codec in [None, 'gzip', 'bz2', 'lzma']:
+        suffix = COMPRESSION_CODECS[codec][1][0] if codec else ""
+        handler = JSONFileHandler(basename + suffix, compression=codec or False,
+                                  compression_level=level)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                start = time.perf_counter()
+                handler.write(payload)
+                write_time = time.perf_counter() - start
+                start = time.perf_counter()
+                assert len(handler.read()) == records
+                read_time = time.perf_counter() - start
+                handler.close()
+            size = os.path.getsize(handler.filename)
+        finally:
+            os.remove(handler.filename)
+        results[codec or 'none'] = (write_time, read_time, size)
+        print(f"  {codec or 'none':5}  write {write_time * 1000:8.1f} ms   read {read_time * 1000:8.1f} ms"
+              f"   {size / 1e6:7.2f} MB on disk")
+    return results
+
+
+def benchmark_line_index(filename="line_index_benchmark.txt", lines=2_000_000):
+    """Reading the last 100 lines: full scan vs a fresh and a reused line index"""
+    with open(filename, 'w', encoding='utf-8') as file:
+        file.writelines(f"line {i} of the benchmark file\n" for i in range(lines))
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            with open(filename, 'r', encoding='utf-8') as file:
+                tail = [line.rstrip('\n') for i, line in enumerate(file) if i >= lines - 100]
+            scan_time = time.perf_counter() - start
+            
+            start = time.perf_counter()
+            handler = TextFileHandler(filename)
+            assert handler.read_lines(-100) == tail
+            build_time = time.perf_counter() - start
+            handler.close()
+            
+            start = time.perf_counter()
+            handler = TextFileHandler(filename)
+            assert handler.read_lines(-100) == tail
+            reuse_time = time.perf_counter() - start
+            handler.close()
+            
+            with open(filename, 'a', encoding='utf-8') as file:
+                file.write("one more line\n")
+            start = time.perf_counter()
+            handler = TextFileHandler(filename)
+            assert handler.read_lines(-1) == ["one more line"]
+            extend_time = time.perf_counter() - start
+            handler.close()
+    finally:
+        os.remove(filename)
+        os.remove(filename + TextFileHandler.LINE_INDEX_SUFFIX)
+    
+    print(f"Last 100 of {lines:,} lines:")
+    print(f"  full scan:             {scan_time * 1000:8.1f} ms")
+    print(f"  build index + read:    {build_time * 1000:8.1f} ms")
+    print(f"  reuse sidecar + read:  {reuse_time * 1000:8.1f} ms")
+    print(f"  extend after append:   {extend_time * 1000:8.1f} ms")
+    return scan_time, build_time, reuse_time, extend_time
+
+
+def benchmark_records(basename="records_benchmark", rows=500_000):
+    """Summing one column: CSV rows parsed into objects vs a record-mode column view"""
+    csv_name, record_name = basename + ".csv", basename + ".bin"
+    rows_data = [(i, i * 0.25, i % 100) for i in range(rows)]
+    with open(csv_name, 'w', newline='') as file:
+        csv.writer(file).writerows(rows_data)
+    handler = BinaryFileHandler(record_name, record_format='<qdq',
+                                record_fields=('id', 'price', 'quantity'))
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            handler.write(b"")
+            start = time.perf_counter()
+            handler.append_records(rows_data)
+            write_time = time.perf_counter() - start
+            
+            start = time.perf_counter()
+            with open(csv_name, newline='') as file:
+                objects = [{"id": int(row[0]), "price": float(row[1]), "quantity": int(row[2])}
+                           for row in csv.reader(file)]
+            csv_total = sum(obj["price"] for obj in objects)
+            csv_time = time.perf_counter() - start
+            
+            start = time.perf_counter()
+            column_total = sum(handler.column('price'))
+            column_time = time.perf_counter() - start
+            
+            start = time.perf_counter()
+            for i in range(0, rows, 97):
+                handler.record(i)
+            lookup_time = (time.perf_counter() - start) / len(range(0, rows, 97))
+            handler.close()
+    finally:
+        os.remove(csv_name)
+        os.remove(record_name)
+    
+    assert csv_total == column_total
+    print(f"Sum of one column over {rows:,} rows:")
+    print(f"  CSV -> objects:      {csv_time * 1000:8.1f} ms")
+    print(f"  record column view:  {column_time * 1000:8.1f} ms")
+    print(f"  append_records():    {write_time * 1000:8.1f} ms")
+    print(f"  record(i) lookup:    {lookup_time * 1e6:8.2f} us")
+    return csv_time, column_time
 
 
 # Demonstration
@@ -210,4 +1931,145 @@ if __name__ == "__main__":
         # This should raise TypeError since FileHandler is abstract
         abstract_handler = FileHandler("test.txt")
     except TypeError as e:
-        print(f"Error (expected): {e}")
\ No newline at end of file
+        print(f"Error (expected): {e}")
+    
+    print("\n=== Streaming Reads ===")
+    stream_handler = TextFileHandler("stream_example.txt")
+    stream_handler.write("héllo wörld " * 10)
+    for chunk in stream_handler.read_iter(chunk_size=16):
+        print(f"Chunk: {chunk!r}")
+    os.remove("stream_example.txt")
+    view = BinaryFileHandler("example.bin").read_view()
+    print(f"Memory-mapped view: {len(view)} bytes, first 6: {bytes(view[:6])!r}")
+    view.release()
+    
+    print("\n=== JSON Lines ===")
+    events = JSONFileHandler("events.jsonl")
+    events.write([{"event": "start", "id": 1}])
+    events.append({"event": "click", "id": 2})
+    events.append_many({"event": "scroll", "id": i} for i in range(3, 5))
+    for record in events.iter_records():
+        print(f"Record: {record}")
+    compact_handler = JSONFileHandler("compact.json", compact=True)
+    compact_handler.write(sample_json)
+    print(f"Compact JSON: {open('compact.json', encoding='utf-8').read()}")
+    os.remove("events.jsonl")
+    os.remove("compact.json")
+    
+    print("\n=== Positioned I/O on a Held Descriptor ===")
+    with BinaryFileHandler("positioned.bin") as handler:
+        handler.write(b"0123456789")
+        handler.write_at(2, b"AB")
+        print(f"Bytes 0-5: {handler.read_at(0, 6)!r}")
+        handler.flush(fsync=True)
+        print(f"Whole file: {handler.read()!r}")
+    os.remove("positioned.bin")
+    
+    print("\n=== Shared Read Cache ===")
+    shared_cache = ReadCache(max_bytes=1024 * 1024)
+    config_handler = JSONFileHandler("config.json")
+    config_handler.cache = shared_cache
+    config_handler.write({"debug": False, "workers": 4})
+    for _ in range(3):
+        config_handler.read()
+    print(f"After 3 reads: {shared_cache.stats()}")
+    config_handler.write({"debug": True, "workers": 8})  # invalidates the entry
+    print(f"After a write, read gives: {config_handler.read()}")
+    print(f"Cache stats: {shared_cache.stats()}")
+    config_handler.close()
+    os.remove("config.json")
+    
+    print("\n=== Pickle with Out-of-Band Buffers ===")
+    pickle_handler = PickleFileHandler("objects.pkl", out_of_band_threshold=16)
+    pickle_handler.write({"name": "samples", "raw": pickle.PickleBuffer(bytearray(b"x" * 32)), "small": b"ok"})
+    loaded = pickle_handler.read()
+    print(f"Loaded: name={loaded['name']!r}, raw is a {type(loaded['raw']).__name__} "
+          f"of {len(loaded['raw'])} bytes, small={loaded['small']!r}")
+    del loaded
+    pickle_handler.close()
+    os.remove("objects.pkl")
+    
+    print("\n=== Bulk Reads and Writes ===")
+    bulk_handlers = [TextFileHandler("bulk1.txt"), JSONFileHandler("bulk2.json"), TextFileHandler("missing/bulk3.txt")]
+    for result in write_many(zip(bulk_handlers, ["first", {"second": 2}, "third"])):
+        print(f"Write {result.filename}: {'ok' if result.error is None else result.error}")
+    for result in read_many(bulk_handlers):
+        print(f"Read {result.filename}: {result.value!r} error={result.error}")
+    os.remove("bulk1.txt")
+    os.remove("bulk2.json")
+    
+    print("\n=== Async Handlers ===")
+    
+    async def async_demo():
+        async with AsyncTextFileHandler("async_example.txt") as handler:
+            await handler.write("Written without blocking the event loop")
+            print(f"Async read: {await handler.read()!r}")
+            async for chunk in handler.read_iter(chunk_size=16):
+                print(f"Async chunk: {chunk!r}")
+    
+    asyncio.run(async_demo())
+    os.remove("async_example.txt")
+    
+    print("\n=== Buffered and Atomic Writes ===")
+    log_handler = TextFileHandler("buffered.log")
+    log_handler.write("")
+    with BufferedFileWriter(log_handler, max_bytes=1024, max_delay=0.05, background=True) as writer:
+        for i in range(3):
+            writer.write(f"event {i}\n")
+        print(f"Before the write-behind flush: {log_handler._load()!r}")
+        time.sleep(0.2)
+        print(f"After the write-behind flush:  {log_handler._load()!r}")
+        writer.rewrite("replaced atomically\n")
+    print(f"After rewrite: {log_handler.read()!r}")
+    log_handler.close()
+    os.remove("buffered.log")
+    
+    print("\n=== Transparent Compression ===")
+    gz_handler = TextFileHandler("compressed.txt.gz", compression_level=6)
+    gz_handler.write("compress me " * 1000)
+    gz_handler.append("and this appended member")
+    print(f"Codec: {gz_handler.compression}, {os.path.getsize('compressed.txt.gz')} bytes on disk")
+    print(f"Tail of decompressed text: {gz_handler.read()[-30:]!r}")
+    gz_handler.close()
+    os.remove("compressed.txt.gz")
+    
+    print("\n=== Line Index ===")
+    lines_handler = TextFileHandler("lines_example.txt")
+    lines_handler.write("".join(f"line {i}\n" for i in range(10)))
+    print(f"{lines_handler.line_count()} lines; lines 3-5: {lines_handler.read_lines(3, 6)}")
+    lines_handler.append("line 10\n")
+    print(f"After append, last two: {lines_handler.read_lines(-2)}")
+    lines_handler.close()
+    os.remove("lines_example.txt")
+    os.remove("lines_example.txt" + TextFileHandler.LINE_INDEX_SUFFIX)
+    
+    print("\n=== Fixed-Width Records ===")
+    with BinaryFileHandler("records.bin", record_format='<qd', record_fields=('id', 'score')) as records:
+        records.write(b"")
+        records.append_records([(1, 9.5), (2, 7.25), (3, 8.0)])
+        records.append_records([(4, 6.5)])
+        print(f"{records.record_count()} records; record 2: {records.record(2)}")
+        print(f"Score column (zero-copy): {records.column('score').tolist()}")
+    os.remove("records.bin")
+    
+    # Benchmarks are slow and write large temporary files: run them with --benchmark
+    if '--benchmark' in sys.argv:
+        print()
+        benchmark_reads()
+        print()
+        benchmark_small_reads()
+        print()
+        print("Large float payload:")
+        benchmark_pickle_vs_json()
+        print()
+        benchmark_bulk_reads()
+        print()
+        benchmark_loop_latency()
+        print()
+        benchmark_tiny_writes()
+        print()
+        benchmark_compression()
+        print()
+        benchmark_line_index()
+        print()
+        benchmark_records()
@@ -1,6 +1,87 @@
+import asyncio
+import contextlib
+import signal
 import socket
+import struct
+import sys
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+# --- Framed Message Protocol ---
+# Every message is a 4-byte big-endian length followed by that many bytes,
+# so messages of any size arrive whole and a connection can carry many.
+FRAME_HEADER = struct.Struct('!I')
+MAX_FRAME_SIZE = 64 * 1024 * 1024
+# Below this size header and payload are joined into one send() call;
+# larger payloads are sent from a memoryview without copying
+SMALL_FRAME_SIZE = 64 * 1024
+
+
+def send_frame(sock, payload):
+    """Send one length-prefixed message with sendall()"""
+    if len(payload) > MAX_FRAME_SIZE:
+        raise ValueError(f"Frame of {len(payload)} bytes exceeds MAX_FRAME_SIZE")
+    header = FRAME_HEADER.pack(len(payload))
+    if len(payload) <= SMALL_FRAME_SIZE:
+        sock.sendall(header + payload)
+    else:
+        sock.sendall(header)
+        sock.sendall(memoryview(payload))
+
+
+class FrameReader:
+    """
+    Reads length-prefixed messages from a socket into one preallocated buffer.
+
+    recv_into() fills the buffer with as much as the socket has, so small
+    messages that arrive together cost one system call between them. The
+    buffer only grows for a message larger than itself. recv_frame()
+    returns a memoryview into the buffer, valid until the next call.
+    """
+
+    def __init__(self, sock, buffer_size=64 * 1024):
+        self.sock = sock
+        self._buffer = bytearray(buffer_size)
+        self._view = memoryview(self._buffer)
+        self._start = 0  # First unread byte
+        self._end = 0    # End of the received data
+
+    def _fill(self, needed):
+        """Make at least `needed` unread bytes available; False on a clean EOF"""
+        available = self._end - self._start
+        if self._start + needed > len(self._buffer):
+            if needed > len(self._buffer):
+                # Grow into a new buffer; views handed out earlier keep the old one alive
+                buffer = bytearray(max(needed, 2 * len(self._buffer)))
+                buffer[:available] = self._view[self._start:self._end]
+                self._buffer, self._view = buffer, memoryview(buffer)
+            else:
+                self._view[:available] = self._view[self._start:self._end]
+            self._start, self._end = 0, available
+        while self._end - self._start < needed:
+            received = self.sock.recv_into(self._view[self._end:])
+            if not received:
+                if self._end == self._start:
+                    return False
+                raise ConnectionError("Connection closed in the middle of a frame")
+            self._end += received
+        return True
+
+    def recv_frame(self):
+        """The next message as a memoryview, or None once the peer has closed"""
+        if not self._fill(FRAME_HEADER.size):
+            return None
+        (length,) = FRAME_HEADER.unpack_from(self._buffer, self._start)
+        if length > MAX_FRAME_SIZE:
+            raise ConnectionError(f"Frame of {length} bytes exceeds MAX_FRAME_SIZE")
+        self._start += FRAME_HEADER.size
+        if not self._fill(length):
+            raise ConnectionError("Connection closed in the middle of a frame")
+        frame = self._view[self._start:self._start + length]
+        self._start += length
+        return frame
 
 # --- Server Code ---
 def server_program():
@@ -31,6 +112,203 @@ def server_program():
         print("Server socket closed.")
 
 
+# --- Long-running asyncio Server ---
+class AsyncServer:
+    """
+    Long-running version of server_program(): greets every client that
+    connects instead of exiting after the first one.
+
+    All connections are served by one asyncio event loop, so thousands of
+    concurrent clients cost a few KB each instead of a thread each.
+    backlog is passed to listen(); each connection is closed after
+    `timeout` seconds; shutdown() stops accepting and gives open
+    connections `grace` seconds to finish before dropping them.
+    The counters below can be read from any thread.
+    """
+
+    def __init__(self, host='127.0.0.1', port=65432, backlog=1024, timeout=10.0,
+                 message="Hello from server!"):
+        self.host = host
+        self.port = port  # 0 picks a free port; the real one is stored on start()
+        self.backlog = backlog
+        self.timeout = timeout
+        self.message = message.encode('utf-8')
+        self.active_connections = 0
+        self.peak_connections = 0
+        self.total_connections = 0
+        self.timed_out = 0
+        self.bytes_sent = 0
+        self._server = None
+        self._tasks = {}  # Connection task -> its StreamWriter
+        self._loop = None
+        self._thread = None
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle, self.host, self.port, backlog=self.backlog)
+        self.port = self._server.sockets[0].getsockname()[1]
+        print(f"Async server listening on {self.host}:{self.port} (backlog {self.backlog})")
+
+    async def _handle(self, reader, writer):
+        task = asyncio.current_task()
+        self._tasks[task] = writer
+        self.active_connections += 1
+        self.total_connections += 1
+        self.peak_connections = max(self.peak_connections, self.active_connections)
+        timed_out = False
+        try:
+            await asyncio.wait_for(self.serve_connection(reader, writer), self.timeout)
+        except asyncio.TimeoutError:
+            self.timed_out += 1
+            timed_out = True
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass  # Client went away, or shutdown() dropped the connection
+        finally:
+            try:
+                if timed_out:
+                    # close() would wait for the unsent buffer to reach a
+                    # client that may never read it; drop it instead
+                    writer.transport.abort()
+                else:
+                    writer.close()
+                with contextlib.suppress(ConnectionError):
+                    await writer.wait_closed()
+            finally:
+                # Stay registered until the socket is really closed, so
+                # shutdown() can still abort it
+                self.active_connections -= 1
+                self._tasks.pop(task, None)
+
+    async def serve_connection(self, reader, writer):
+        """Per-connection protocol: send the greeting, like server_program()"""
+        writer.write(self.message)
+        await writer.drain()
+        self.bytes_sent += len(self.message)
+
+    async def shutdown(self, grace=5.0):
+        """Stop accepting, let open connections finish, then drop the rest"""
+        if self._server is None:
+            return
+        self._server.close()
+        # Let connections accepted just before close() start their handlers,
+        # so they are registered below instead of being left behind
+        await asyncio.sleep(0)
+        if self._tasks:
+            _, pending = await asyncio.wait(set(self._tasks), timeout=grace)
+            if pending:
+                # Abort the remaining connections so their handlers fail on
+                # I/O and finish; cancel any that still do not
+                for task in pending:
+                    writer = self._tasks.get(task)
+                    if writer is not None:
+                        writer.transport.abort()
+                _, pending = await asyncio.wait(pending, timeout=1.0)
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+        # Only now: on Python 3.12+ wait_closed() also waits for every
+        # open connection, which would make the grace period meaningless
+        await self._server.wait_closed()
+        self._server = None
+        print(f"Async server stopped after {self.total_connections} connections, {self.bytes_sent} bytes sent.")
+
+    async def run(self):
+        """Serve until SIGINT/SIGTERM, then shut down gracefully"""
+        await self.start()
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            with contextlib.suppress(NotImplementedError):  # Not available on Windows
+                loop.add_signal_handler(signum, stop.set)
+        try:
+            await stop.wait()
+        finally:
+            await self.shutdown()
+
+    def start_in_thread(self):
+        """Run the server's event loop in a background thread; returns once it is listening"""
+        ready = threading.Event()
+        errors = []
+
+        def run_loop():
+            self._loop = asyncio.new_event_loop()
+            try:
+                self._loop.run_until_complete(self.start())
+            except OSError as e:
+                errors.append(e)
+                ready.set()
+                self._loop.close()
+                return
+            ready.set()
+            self._loop.run_forever()
+            self._loop.close()
+
+        self._thread = threading.Thread(target=run_loop, name="AsyncServer", daemon=True)
+        self._thread.start()
+        ready.wait()
+        if errors:
+            raise errors[0]
+        return self
+
+    def stop_thread(self, grace=5.0):
+        """Shut down a server started with start_in_thread()"""
+        if self._thread is None:
+            return
+        asyncio.run_coroutine_threadsafe(self.shutdown(grace), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._thread = None
+
+
+class FramedServer(AsyncServer):
+    """
+    AsyncServer speaking the framed protocol: every request frame gets a
+    response frame from handle_request() (an echo by default), on the same
+    connection for as long as the client keeps it open.
+
+    A connection is closed once it has been idle for idle_timeout seconds
+    rather than after a fixed total time, since pooled clients keep
+    connections open across many requests.
+    """
+
+    def __init__(self, host='127.0.0.1', port=65432, backlog=1024, idle_timeout=30.0):
+        super().__init__(host, port, backlog, timeout=None)
+        self.idle_timeout = idle_timeout
+        self.requests = 0
+
+    def handle_request(self, payload):
+        return payload
+
+    async def serve_connection(self, reader, writer):
+        while True:
+            try:
+                header = await asyncio.wait_for(reader.readexactly(FRAME_HEADER.size), self.idle_timeout)
+            except asyncio.IncompleteReadError as e:
+                if e.partial:
+                    raise
+                return  # Client closed between requests
+            except asyncio.TimeoutError:
+                self.timed_out += 1
+                return
+            (length,) = FRAME_HEADER.unpack(header)
+            if length > MAX_FRAME_SIZE:
+                return
+            payload = await asyncio.wait_for(reader.readexactly(length), self.idle_timeout)
+            response = self.handle_request(payload)
+            writer.write(FRAME_HEADER.pack(len(response)))
+            writer.write(response)
+            await writer.drain()
+            self.requests += 1
+            self.bytes_sent += FRAME_HEADER.size + len(response)
+
+
+def async_server_program(backlog=1024, timeout=10.0):
+    """Long-running server mode: serves every client until Ctrl+C"""
+    try:
+        asyncio.run(AsyncServer(backlog=backlog, timeout=timeout).run())
+    except OSError as e:
+        print(f"Server error: {e}")
+
+
 # --- Client Code ---
 def client_program():
     """
@@ -42,7 +320,8 @@ def client_program():
     client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
     try:
         client_socket.connect((host, port))
-        data = client_socket.recv(1024)  # Receive data from the server
+        # Receive data until the server closes, so longer messages are not cut at 1 KB
+        data = b''.join(iter(partial(client_socket.recv, 4096), b''))
         print(f"Received from server: '{data.decode('utf-8')}'")
 
     except ConnectionRefusedError:
@@ -54,7 +333,186 @@ def client_program():
         print("Client socket closed.")
 
 
+class FramedConnection:
+    """One persistent client connection speaking the framed protocol"""
+
+    def __init__(self, host='127.0.0.1', port=65432, timeout=5.0):
+        self.sock = socket.create_connection((host, port), timeout=timeout)
+        # Requests are small and latency-bound: don't let Nagle's algorithm hold them back
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.reader = FrameReader(self.sock)
+
+    def request(self, payload):
+        """Send a request frame and return the response as bytes"""
+        send_frame(self.sock, payload)
+        response = self.reader.recv_frame()
+        if response is None:
+            raise ConnectionError("Server closed the connection")
+        return bytes(response)
+
+    def close(self):
+        self.sock.close()
+
+
+class ClientPool:
+    """
+    Reuses persistent FramedConnections across requests, so each request
+    skips the TCP handshake and teardown. Safe to share between threads:
+    at most `size` connections are open at once and a thread waits for a
+    free one beyond that.
+
+    A pooled connection the server has since closed (e.g. after its idle
+    timeout) fails on use; the request is then retried once on a new
+    connection, so requests must be safe to repeat.
+    """
+
+    def __init__(self, host='127.0.0.1', port=65432, size=8, timeout=5.0):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self._idle = []
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(size)
+        self.connections_opened = 0
+
+    def _connect(self):
+        self.connections_opened += 1
+        return FramedConnection(self.host, self.port, self.timeout)
+
+    def _checkout(self):
+        """An idle connection or a new one, and whether it was reused"""
+        with self._lock:
+            if self._idle:
+                return self._idle.pop(), True
+        return self._connect(), False
+
+    def _checkin(self, connection):
+        with self._lock:
+            self._idle.append(connection)
+
+    @contextlib.contextmanager
+    def connection(self):
+        """Borrow a connection; it is closed instead of returned if the block fails"""
+        with self._slots:
+            connection, _ = self._checkout()
+            try:
+                yield connection
+            except BaseException:
+                connection.close()
+                raise
+            self._checkin(connection)
+
+    def request(self, payload):
+        """Send a request on a pooled connection and return the response as bytes"""
+        with self._slots:
+            connection, reused = self._checkout()
+            try:
+                try:
+                    response = connection.request(payload)
+                except ConnectionError:
+                    if not reused:
+                        raise
+                    # Stale pooled connection: retry once on a fresh one
+                    connection.close()
+                    connection = self._connect()
+                    response = connection.request(payload)
+            except BaseException:
+                connection.close()
+                raise
+            self._checkin(connection)
+            return response
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for connection in idle:
+            connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def benchmark_async_server(clients=5_000, concurrency=1_000):
+    """Many simultaneous local clients against AsyncServer; reports connections/sec"""
+    server = AsyncServer(port=0, backlog=concurrency).start_in_thread()
+    expected = server.message
+
+    async def client(limit):
+        async with limit:
+            reader, writer = await asyncio.open_connection(server.host, server.port)
+            try:
+                return await reader.read() == expected  # Server closes after the greeting
+            finally:
+                writer.close()
+
+    async def run_clients():
+        limit = asyncio.Semaphore(concurrency)
+        return await asyncio.gather(*(client(limit) for _ in range(clients)))
+
+    try:
+        start = time.perf_counter()
+        results = asyncio.run(run_clients())
+        elapsed = time.perf_counter() - start
+    finally:
+        server.stop_thread()
+    assert all(results) and server.total_connections == clients
+    print(f"{clients:,} clients, up to {concurrency:,} at once:")
+    print(f"  {clients / elapsed:9,.0f} connections/sec ({elapsed:.2f} s)")
+    print(f"  peak active connections: {server.peak_connections:,}, bytes sent: {server.bytes_sent:,}")
+
+
+def benchmark_client_pool(requests=2_000, sizes=(100, 256 * 1024), threads=8):
+    """Round-trip latency and throughput of framed requests, with and without ClientPool"""
+    server = FramedServer(port=0).start_in_thread()
+    try:
+        for size in sizes:
+            payload = b'x' * size
+            count = requests if size <= SMALL_FRAME_SIZE else requests // 10
+
+            def unpooled():
+                connection = FramedConnection(server.host, server.port)
+                try:
+                    return connection.request(payload)
+                finally:
+                    connection.close()
+
+            print(f"{count:,} requests of {size:,} bytes:")
+            with ClientPool(server.host, server.port, size=threads) as pool:
+                for label, call in (("new connection each", unpooled), ("ClientPool", partial(pool.request, payload))):
+                    # Latency: one request at a time
+                    latencies = []
+                    for _ in range(count):
+                        start = time.perf_counter()
+                        assert call() == payload
+                        latencies.append(time.perf_counter() - start)
+                    latencies.sort()
+                    # Throughput: `threads` clients at once
+                    start = time.perf_counter()
+                    with ThreadPoolExecutor(threads) as executor:
+                        assert all(response == payload for response in executor.map(lambda _: call(), range(count)))
+                    elapsed = time.perf_counter() - start
+                    print(f"  {label:<20} mean {sum(latencies) / count * 1e6:7.0f} us, "
+                          f"p99 {latencies[int(count * 0.99)] * 1e6:7.0f} us, "
+                          f"{count / elapsed:8,.0f} req/s with {threads} threads")
+                print(f"  (pool opened {pool.connections_opened} connections)")
+    finally:
+        server.stop_thread()
+
+
 if __name__ == '__main__':
+    if '--serve' in sys.argv:
+        # Long-running mode: python question10.py --serve (Ctrl+C stops it gracefully)
+        async_server_program()
+        sys.exit()
+    if '--benchmark' in sys.argv:
+        benchmark_async_server()
+        print()
+        benchmark_client_pool()
+        sys.exit()
+
     # To run this program:
     # 1. Open a terminal and run this script: python your_script_name.py
     # 2. The server will start.
@@ -1,24 +1,170 @@
+import bisect
+import mmap
+import os
+import sys
+import time
+from array import array
+from itertools import accumulate
+
 # A list of names to be written to the file
 names = ["Alice", "Bob", "Charlie", "David", "Eve"]
 
 # File path
 file_path = "names.txt"
 
-try:
-    # Write the names to the file
-    # The 'with' statement ensures the file is properly closed even if errors occur.
-    with open(file_path, 'w') as file:
-        for name in names:
-            file.write(name + '\n')
-    
-    print(f"Successfully wrote names to {file_path}")
-
-    print("\nReading names from the file:")
-    # Read the names from the file and print them
-    with open(file_path, 'r') as file:
+
+def write_sorted_names(path, names, batch_size=100_000):
+    """
+    Sort the names and write them one per line in large batches.
+
+    A single writelines() call per batch replaces one write() call per name,
+    and the sorted order is what lets SortedNameFile answer lookups with a
+    binary search.
+    """
+    names = sorted(names)
+    with open(path, 'w', encoding='utf-8', buffering=1024 * 1024) as file:
+        for start in range(0, len(names), batch_size):
+            file.writelines(name + '\n' for name in names[start:start + batch_size])
+    return len(names)
+
+
+class SortedNameFile:
+    """
+    Membership and prefix queries on a file written by write_sorted_names().
+
+    The file is memory-mapped and a table with the byte offset of every
+    line is built in one chunked pass (8 bytes per name). Lookups then
+    binary-search that table, touching only O(log n) lines of the file.
+    UTF-8 byte order matches Python's str order, so the bytes are compared
+    directly.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as file:
+            size = os.fstat(file.fileno()).st_size
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        self._offsets = self._line_offsets(self._map)
+
+    @staticmethod
+    def _line_offsets(data, chunk_size=1024 * 1024):
+        """Start offset of every line, plus the end of the last line"""
+        offsets = array('Q', [0])
+        for position in range(0, len(data), chunk_size):
+            parts = data[position:position + chunk_size].split(b'\n')
+            # Each newline starts a new line one byte later
+            starts = accumulate(map((1).__add__, map(len, parts[:-1])), initial=position)
+            next(starts)
+            offsets.extend(starts)
+        if offsets[-1] != len(data):
+            offsets.append(len(data) + 1)  # Last line has no trailing newline
+        return offsets
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index):
+        """Line index as bytes (without the newline)"""
+        if not 0 <= index < len(self):
+            raise IndexError("line index out of range")
+        return self._map[self._offsets[index]:self._offsets[index + 1] - 1]
+
+    def contains(self, name):
+        target = name.encode('utf-8')
+        index = bisect.bisect_left(self, target)
+        return index < len(self) and self[index] == target
+
+    def prefix(self, prefix, limit=None):
+        """All names starting with prefix, in sorted order"""
+        target = prefix.encode('utf-8')
+        index = bisect.bisect_left(self, target)
+        matches = []
+        while index < len(self) and (limit is None or len(matches) < limit):
+            line = self[index]
+            if not line.startswith(target):
+                break
+            matches.append(line.decode('utf-8'))
+            index += 1
+        return matches
+
+    def close(self):
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def linear_contains(path, name):
+    """The original approach: read the file line by line"""
+    with open(path, 'r') as file:
         for line in file:
-            # .strip() removes leading/trailing whitespace, including the newline character
-            print(line.strip())
+            if line.strip() == name:
+                return True
+    return False
+
+
+def benchmark_name_lookups(path="names_benchmark.txt", count=1_000_000, queries=200):
+    """Compare linear scans with SortedNameFile binary searches"""
+    generated = [f"name{i:07d}" for i in range(0, count * 7, 7)]
+    start = time.perf_counter()
+    write_sorted_names(path, generated)
+    write_time = time.perf_counter() - start
+    probes = [f"name{i:07d}" for i in range(0, count * 7, count * 7 // queries)]
+    try:
+        start = time.perf_counter()
+        linear_hits = sum(linear_contains(path, name) for name in probes[-5:])
+        linear_time = (time.perf_counter() - start) / 5
+
+        start = time.perf_counter()
+        with SortedNameFile(path) as index:
+            open_time = time.perf_counter() - start
+            start = time.perf_counter()
+            hits = sum(index.contains(name) for name in probes)
+            search_time = (time.perf_counter() - start) / len(probes)
+            assert hits and linear_hits == sum(index.contains(name) for name in probes[-5:])
+    finally:
+        os.remove(path)
+
+    print(f"{count:,} names:")
+    print(f"  bulk sorted write:       {write_time * 1000:9.1f} ms")
+    print(f"  linear scan per lookup:  {linear_time * 1000:9.1f} ms")
+    print(f"  index open (one pass):   {open_time * 1000:9.1f} ms")
+    print(f"  binary search lookup:    {search_time * 1e6:9.1f} us")
+    return linear_time, search_time
+
+
+if __name__ == "__main__":
+    try:
+        # Write the names to the file
+        # The 'with' statement ensures the file is properly closed even if errors occur.
+        with open(file_path, 'w') as file:
+            for name in names:
+                file.write(name + '\n')
+
+        print(f"Successfully wrote names to {file_path}")
+
+        print("\nReading names from the file:")
+        # Read the names from the file and print them
+        with open(file_path, 'r') as file:
+            for line in file:
+                # .strip() removes leading/trailing whitespace, including the newline character
+                print(line.strip())
+
+        # Sorted file with binary-search lookups
+        write_sorted_names(file_path, names + ["Alicia", "Bobby"])
+        with SortedNameFile(file_path) as index:
+            print(f"\nContains 'Charlie'? {index.contains('Charlie')}")
+            print(f"Contains 'Zoe'? {index.contains('Zoe')}")
+            print(f"Names starting with 'Al': {index.prefix('Al')}")
+
+    except IOError as e:
+        print(f"An error occurred: {e}")
 
-except IOError as e:
-    print(f"An error occurred: {e}")
+    # The benchmark writes a 1,000,000-name file: run it with --benchmark
+    if '--benchmark' in sys.argv:
+        print()
+        benchmark_name_lookups()
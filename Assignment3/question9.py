@@ -1,24 +1,150 @@
+import codecs
+import mmap
+import os
 import re
+import sys
+import time
+import tracemalloc
+from array import array
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import chain
+
+# A common regex for finding email addresses, compiled once at import time
+EMAIL_PATTERN = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
+EMAIL_REGEX = re.compile(EMAIL_PATTERN)
+# Same pattern for scanning raw bytes (word boundaries are ASCII-only here)
+EMAIL_REGEX_BYTES = re.compile(EMAIL_PATTERN.encode('ascii'))
+WHITESPACE_BYTES = re.compile(rb'\s')
+# The pieces split_by_non_alphanumeric() leaves between its \W+ separators
+TOKEN_REGEX = re.compile(r'\w+')
+PARTIAL_TOKEN_REGEX = re.compile(r'\w+\Z')
+
+# Lookup tables for validate_dates(): every "YYYY-" prefix, the leap-year
+# ones, and every valid "MM-DD" except 02-29 (which needs a leap year)
+DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+YEARS = frozenset(f"{year:04d}-" for year in range(10000))
+LEAP_YEARS = frozenset(f"{year:04d}-" for year in range(0, 10000, 4) if year % 100 != 0 or year % 400 == 0)
+MONTH_DAYS = frozenset(f"{month:02d}-{day:02d}"
+                       for month, days in enumerate(DAYS_IN_MONTH, 1) for day in range(1, days + 1))
+YEARS_BYTES, LEAP_YEARS_BYTES, MONTH_DAYS_BYTES = (
+    frozenset(value.encode('ascii') for value in table) for table in (YEARS, LEAP_YEARS, MONTH_DAYS))
 
 def extract_emails(text):
     """
     I. Uses regular expressions to extract all email addresses from a given text.
     """
-    # A common regex for finding email addresses
-    email_regex = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    return re.findall(email_regex, text)
+    return EMAIL_REGEX.findall(text)
+
+def _split_at_whitespace(data, parts):
+    """
+    Split data into about `parts` byte ranges whose boundaries fall on
+    whitespace. An email can never contain whitespace, so no match can
+    cross a boundary: each boundary is moved forward past the nominal cut
+    until it reaches a whitespace byte, i.e. far enough to cover any match
+    in progress.
+    """
+    size = len(data)
+    boundaries = [0]
+    for i in range(1, parts):
+        nominal = max(size * i // parts, boundaries[-1])
+        found = WHITESPACE_BYTES.search(data, nominal)
+        cut = found.start() if found else size
+        if cut > boundaries[-1]:
+            boundaries.append(cut)
+    if boundaries[-1] < size:
+        boundaries.append(size)
+    return list(zip(boundaries, boundaries[1:]))
+
+def _scan_emails(path, start, end):
+    """Worker: emails in data[start:end] of a memory-mapped file"""
+    with open(path, 'rb') as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            # pos/endpos scan the map in place instead of copying a slice
+            return [match.decode('ascii') for match in EMAIL_REGEX_BYTES.findall(data, start, end)]
+
+def extract_emails_from_file(path, workers=None, chunk_size=16 * 1024 * 1024):
+    """
+    Generator yielding every email address in a (possibly huge) file.
+
+    The file is memory-mapped and cut into chunk_size ranges on whitespace
+    boundaries, so a match is never split between two ranges and never
+    found twice. With workers > 1 the ranges are scanned in a process pool
+    with the precompiled pattern; matches stream back range by range in
+    file order. At most 2 * workers ranges are in flight, so results never
+    pile up in memory when the consumer is slower than the workers.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    with open(path, 'rb') as file:
+        size = os.fstat(file.fileno()).st_size
+        if size == 0:
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            ranges = _split_at_whitespace(data, max(1, -(-size // chunk_size)))
+
+    if workers <= 1 or len(ranges) == 1:
+        for start, end in ranges:
+            yield from _scan_emails(path, start, end)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        try:
+            for start, end in ranges:
+                if len(pending) >= 2 * workers:
+                    yield from pending.popleft().result()
+                pending.append(executor.submit(_scan_emails, path, start, end))
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            # Closing the generator early should not wait for unread ranges
+            for future in pending:
+                future.cancel()
 
 def validate_date(date_string):
     """
     II. Uses regular expressions to validate a date in the format "YYYY-MM-DD".
     """
     # Regex to check for YYYY-MM-DD format.
-    # This is a basic format check, not a validation of valid dates (e.g., 2023-02-30)
+    # This is a basic format check, not a validation of valid dates (e.g., 2023-02-30);
+    # validate_dates() does the calendar check for many values at once
     date_regex = r'^\d{4}-\d{2}-\d{2}$'
     if re.fullmatch(date_regex, date_string):
         return True
     return False
 
+def validate_dates(values):
+    """
+    Calendar-correct YYYY-MM-DD check for many values at once.
+
+    values is an iterable of str or bytes, or a bytes-like buffer (e.g. a
+    file read in binary mode) holding one date per line. Returns an
+    array('b') with 1 for each valid date and 0 otherwise.
+
+    Instead of a regex, each value is split at fixed positions and both
+    halves are looked up in precomputed sets: the "YYYY-" prefix among
+    all 10,000 years and the "MM-DD" part among the real month/day pairs.
+    02-29 is looked up in the leap-year prefixes instead. Two 5-character
+    slices that are both found also imply the length is exactly 10.
+    Unlike validate_date(), only ASCII digits are accepted.
+    """
+    if isinstance(values, (bytes, bytearray, memoryview)):
+        values = bytes(values).splitlines()
+    values = iter(values)
+    first = next(values, None)
+    if first is None:
+        return array('b')
+    values = chain((first,), values)
+    if isinstance(first, (bytes, bytearray)):
+        years, leap_years, month_days, leap_day = YEARS_BYTES, LEAP_YEARS_BYTES, MONTH_DAYS_BYTES, b'02-29'
+    else:
+        years, leap_years, month_days, leap_day = YEARS, LEAP_YEARS, MONTH_DAYS, '02-29'
+    return array('b', [
+        value[5:] in month_days and value[:5] in years or value[5:] == leap_day and value[:5] in leap_years
+        for value in values
+    ])
+
 def replace_word(text, old_word, new_word):
     """
     III. Uses regular expressions to replace all occurrences of a word with another word.
@@ -33,6 +159,344 @@ def split_by_non_alphanumeric(text):
     # \W+ matches one or more non-alphanumeric characters
     return re.split(r'\W+', text)
 
+def iter_tokens(source, chunk_size=1024 * 1024):
+    """
+    Generator yielding the non-empty pieces split_by_non_alphanumeric()
+    would return, without building a list.
+
+    source is a str, a text file object (read chunk_size characters at a
+    time) or any iterable of str chunks. Memory stays at about one chunk
+    however large the input is.
+    """
+    if isinstance(source, str):
+        for match in TOKEN_REGEX.finditer(source):
+            yield match.group()
+        return
+    if hasattr(source, 'read'):
+        source = iter(partial(source.read, chunk_size), '')
+    for text in _whole_token_chunks(source):
+        # findall() collects a chunk's tokens in C; empties never match \w+
+        yield from TOKEN_REGEX.findall(text)
+
+def _whole_token_chunks(chunks):
+    """
+    Re-cut str chunks so that none ends inside a token: a token touching
+    the end of a chunk may continue in the next one, so it is carried over.
+    """
+    carry = ''
+    for chunk in chunks:
+        text = carry + chunk if carry else chunk
+        # Search only the tail, widening it while the token might start earlier
+        window = 64
+        while True:
+            tail = max(0, len(text) - window)
+            partial_token = PARTIAL_TOKEN_REGEX.search(text, tail)
+            if not partial_token or partial_token.start() > tail or tail == 0:
+                break
+            window *= 2
+        cut = partial_token.start() if partial_token else len(text)
+        carry = text[cut:]
+        if cut:
+            yield text[:cut]
+    if carry:
+        yield carry
+
+def _count_words(path, start, end, chunk_size=1024 * 1024):
+    """Worker: Counter of the tokens in bytes [start, end) of a UTF-8 file"""
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    with open(path, 'rb') as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            # The decoder holds back a multi-byte character split between chunks
+            chunks = (decoder.decode(data[position:min(position + chunk_size, end)], position + chunk_size >= end)
+                      for position in range(start, end, chunk_size))
+            counts = Counter()
+            for text in _whole_token_chunks(chunks):
+                counts.update(TOKEN_REGEX.findall(text))
+            return counts
+
+def word_counts(path, workers=None, chunk_size=16 * 1024 * 1024):
+    """
+    Counter of every token in a UTF-8 file, counted in parallel shards.
+
+    The file is cut into chunk_size shards on whitespace, like
+    extract_emails_from_file(), so no token is split between shards
+    (whitespace bytes never occur inside a multi-byte UTF-8 character
+    either). Each worker decodes its shard a chunk at a time, re-cuts the
+    chunks on token boundaries like iter_tokens() and counts each chunk's
+    findall() result into a Counter; the parent merges those one by one,
+    so memory grows with the vocabulary, not with the file.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    with open(path, 'rb') as file:
+        size = os.fstat(file.fileno()).st_size
+        if size == 0:
+            return Counter()
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            ranges = _split_at_whitespace(data, max(1, -(-size // chunk_size)))
+
+    counts = Counter()
+    if workers <= 1 or len(ranges) == 1:
+        for start, end in ranges:
+            counts.update(_count_words(path, start, end))
+        return counts
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        paths = [path] * len(ranges)
+        starts, ends = zip(*ranges)
+        for shard_counts in executor.map(_count_words, paths, starts, ends):
+            counts.update(shard_counts)
+    return counts
+
+def _trie_pattern(words):
+    """
+    Regex alternation for words factored by common prefixes, e.g.
+    ['cat', 'car', 'cart'] -> 'ca(?:rt?|t)'. The regex engine then walks
+    one trie branch instead of trying every word at each position.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = None  # End of a word
+
+    def build(node):
+        is_end = '' in node
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        if all(len(branch) == 1 for branch in branches) and len(branches) > 1:
+            body = '[' + ''.join(branches) + ']'
+        elif len(branches) == 1 and (not is_end or len(branches[0]) == 1):
+            body = branches[0]
+        else:
+            body = '(?:' + '|'.join(branches) + ')'
+        return body + '?' if is_end else body
+
+    return build(trie)
+
+def _is_word_char(char):
+    return char.isalnum() or char == '_'
+
+class _AhoCorasick:
+    """
+    Aho-Corasick automaton over lowercased keys, for dictionaries too big
+    to compile into one regex. Finds whole-word, leftmost-longest matches.
+    """
+
+    def __init__(self, words):
+        self.goto = [{}]
+        self.fail = [0]
+        self.lengths = [()]  # Lengths of the keys ending in each state
+        for word in words:
+            state = 0
+            for char in word:
+                following = self.goto[state].get(char)
+                if following is None:
+                    following = len(self.goto)
+                    self.goto[state][char] = following
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.lengths.append(())
+                state = following
+            self.lengths[state] = (len(word),)
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, following in self.goto[state].items():
+                queue.append(following)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[following] = self.goto[fallback].get(char, 0)
+                self.lengths[following] += self.lengths[self.fail[following]]
+
+    def matches(self, text, lowered, pos=0):
+        """(start, end) of whole-word matches in text[pos:], leftmost-longest"""
+        goto, fail, lengths = self.goto, self.fail, self.lengths
+        state = 0
+        candidates = []
+        for index in range(pos, len(lowered)):
+            char = lowered[index]
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for length in lengths[state]:
+                start, end = index + 1 - length, index + 1
+                if start < pos:
+                    continue
+                # Same test as \b on both sides of the match
+                if start > 0 and _is_word_char(text[start - 1]) and _is_word_char(text[start]):
+                    continue
+                if end < len(text) and _is_word_char(text[end]) and _is_word_char(text[end - 1]):
+                    continue
+                candidates.append((start, -end))
+        candidates.sort()
+        last_end = pos
+        for start, negative_end in candidates:
+            if start >= last_end:
+                last_end = -negative_end
+                yield start, last_end
+
+class Replacer:
+    """
+    Replaces many words in one pass; the multi-word version of replace_word().
+
+    Matching is whole-word and case-insensitive like replace_word(), but
+    replacements are inserted literally and never re-scanned, so 'a' -> 'b'
+    and 'b' -> 'c' turn 'a b' into 'b c' (not 'c c'). Where keys overlap
+    the longest one wins.
+
+    Strategies ('auto' picks one from the dictionary):
+      'trie'          one prefix-factored regex alternation
+      'words'         a \\w+ scan with a dict lookup per word (huge dictionaries
+                      of plain words)
+      'aho-corasick'  a Python Aho-Corasick automaton (huge dictionaries
+                      whose keys contain spaces or punctuation)
+    """
+
+    TRIE_MAX_WORDS = 20_000
+    WORD_REGEX = re.compile(r'\w+')
+
+    def __init__(self, mapping, strategy='auto'):
+        self.mapping = {old.lower(): new for old, new in mapping.items()}
+        self.max_key_length = max(map(len, self.mapping), default=0)
+        if strategy == 'auto':
+            if len(self.mapping) <= self.TRIE_MAX_WORDS:
+                strategy = 'trie'
+            elif all(self.WORD_REGEX.fullmatch(key) for key in self.mapping):
+                strategy = 'words'
+            else:
+                strategy = 'aho-corasick'
+        self.strategy = strategy
+        if strategy == 'trie':
+            self._regex = re.compile(r'\b(?:' + _trie_pattern(self.mapping) + r')\b', re.IGNORECASE)
+        elif strategy == 'aho-corasick':
+            self._automaton = _AhoCorasick(self.mapping)
+        elif strategy != 'words':
+            raise ValueError(f"Unknown strategy {strategy!r}")
+
+    def _matches(self, text, pos=0):
+        """(start, end) of every replaceable word in text[pos:]"""
+        if not self.mapping:
+            return
+        if self.strategy == 'trie':
+            for match in self._regex.finditer(text, pos):
+                yield match.span()
+        elif self.strategy == 'words':
+            mapping = self.mapping
+            for match in self.WORD_REGEX.finditer(text, pos):
+                # Skip the tail of a word that started before pos
+                if match.start() == pos and pos and _is_word_char(text[pos - 1]):
+                    continue
+                if match.group().lower() in mapping:
+                    yield match.span()
+        else:
+            lowered = text.lower()
+            if len(lowered) != len(text):
+                # Keep offsets aligned when lower() changes the length
+                lowered = ''.join(c if len(c.lower()) != 1 else c.lower() for c in text)
+            yield from self._automaton.matches(text, lowered, pos)
+
+    def _replace_range(self, text, pos, stop):
+        """Replaced text[pos:...] for matches starting before stop; returns (pieces, end)"""
+        pieces, position, mapping = [], pos, self.mapping
+        for start, end in self._matches(text, pos):
+            if start >= stop:
+                break
+            pieces.append(text[position:start])
+            word = text[start:end]
+            pieces.append(mapping.get(word.lower(), word))
+            position = end
+        return pieces, position
+
+    def replace(self, text):
+        """Return text with every dictionary word replaced"""
+        pieces, position = self._replace_range(text, 0, len(text))
+        pieces.append(text[position:])
+        return ''.join(pieces)
+
+    def replace_stream(self, chunks):
+        """
+        Generator applying replace() to a stream of text chunks.
+
+        Only the last max_key_length + 1 characters of each chunk are held
+        back, because only a match starting there could continue into the
+        next chunk or depend on its first character for the word boundary.
+        """
+        buffer, offset = '', 0  # offset: where unemitted text starts in buffer
+        for chunk in chunks:
+            buffer += chunk
+            stop = len(buffer) - self.max_key_length - 1
+            if stop <= offset:
+                continue
+            pieces, position = self._replace_range(buffer, offset, stop)
+            cut = max(position, stop)
+            pieces.append(buffer[position:cut])
+            yield ''.join(pieces)
+            # Keep one emitted character as word-boundary context
+            buffer, offset = buffer[cut - 1:], 1
+        pieces, position = self._replace_range(buffer, offset, len(buffer))
+        pieces.append(buffer[position:])
+        yield ''.join(pieces)
+
+class Scanner:
+    """
+    Finds emails, ISO dates, tokens and any registered kinds in one pass.
+
+    All kinds are compiled into a single alternation with one named group
+    per kind and scanned with a single findall(). Where kinds overlap, the
+    earlier kind wins: emails, then dates, then registered kinds in
+    registration order, then tokens. So "bob@example.com" is reported as
+    an email, not as the tokens "bob", "example" and "com".
+
+    Routing happens in C: findall() returns one tuple per match with an
+    empty string for every kind that did not match, and each kind's
+    column of that table is filtered for non-empty values.
+    """
+
+    BUILTIN_KINDS = [
+        ("emails", EMAIL_PATTERN),
+        ("dates", r'\b\d{4}-\d{2}-\d{2}\b'),
+    ]
+    TOKEN_KIND = ("tokens", r'\w+')
+
+    def __init__(self):
+        self._custom_kinds = []
+        self._regex = None
+
+    def register(self, kind, pattern):
+        """
+        Add a kind of match. kind must be a valid identifier and pattern
+        must not contain capturing groups (use (?:...) instead).
+        """
+        if not kind.isidentifier():
+            raise ValueError(f"kind must be an identifier, got {kind!r}")
+        if kind in self.kinds:
+            raise ValueError(f"kind {kind!r} is already registered")
+        if re.compile(pattern).groups:
+            raise ValueError("pattern must not contain capturing groups; use (?:...)")
+        self._custom_kinds.append((kind, pattern))
+        self._regex = None  # Recompile lazily on the next scan
+
+    @property
+    def kinds(self):
+        return [kind for kind, _ in self.BUILTIN_KINDS + self._custom_kinds + [self.TOKEN_KIND]]
+
+    def _compiled(self):
+        if self._regex is None:
+            kinds = self.BUILTIN_KINDS + self._custom_kinds + [self.TOKEN_KIND]
+            self._regex = re.compile('|'.join(f'(?P<{kind}>{pattern})' for kind, pattern in kinds))
+        return self._regex
+
+    def scan(self, text):
+        """Return a dict mapping every kind to the list of its matches, in text order"""
+        regex = self._compiled()
+        rows = regex.findall(text)
+        if not rows:
+            return {kind: [] for kind in self.kinds}
+        return {kind: list(filter(None, column)) for kind, column in zip(self.kinds, zip(*rows))}
+
 def main():
     """
     Main function to demonstrate the regex operations.
@@ -53,7 +517,9 @@ def main():
     print(f"Is '{date1}' a valid format? {validate_date(date1)}")
     print(f"Is '{date2}' a valid format? {validate_date(date2)}")
     print(f"Is '{date3}' a valid format? {validate_date(date3)}")
-    print(f"Is '{date4}' a valid format? {validate_date(date4)}\n")
+    print(f"Is '{date4}' a valid format? {validate_date(date4)}")
+    dates = [date1, "2023-02-30", "2024-02-29", "2023-02-29", "1900-02-29", "2000-02-29", date2]
+    print(f"Calendar-valid {dates}: {list(validate_dates(dates))}\n")
 
     # --- III. Replace Word ---
     print("--- III. Replacing a Word ---")
@@ -71,8 +537,171 @@ def main():
     # Filter out empty strings that can result from leading/trailing delimiters
     split_words = [word for word in split_words if word]
     print(f"Original text: '{sample_text_split}'")
-    print(f"Split words: {split_words}\n")
+    print(f"Split words: {split_words}")
+    # Same tokens from a generator, without the empty strings
+    print(f"Streamed tokens: {list(iter_tokens(iter(['Hello, wor', 'ld! This is a te', 'st...123.'])))}\n")
+
+    # --- One-pass multi-word replace ---
+    print("--- One-Pass Multi-Word Replace ---")
+    replacer = Replacer({"quick": "FAST", "lazy": "SLEEPY", "the fox": "THE WOLF"})
+    print(f"Original text: '{sample_text_replace}'")
+    print(f"After Replacer ({replacer.strategy}): '{replacer.replace(sample_text_replace)}'\n")
+
+    # --- Single-pass Scanner ---
+    print("--- Single-Pass Scanner ---")
+    scanner = Scanner()
+    scanner.register("amounts", r'\$\d+(?:\.\d{2})?')
+    sample_text_scan = "Invoice 2023-10-26 for $99.50 sent to billing@example.com today."
+    for kind, matches in scanner.scan(sample_text_scan).items():
+        print(f"{kind}: {matches}")
+    print()
+
+
+def benchmark_email_extraction(path="emails_benchmark.txt", megabytes=64, chunk_size=4 * 1024 * 1024):
+    """extract_emails() on the whole text vs extract_emails_from_file() with 1..N workers"""
+    line = "From: alice.smith@example.com To: bob@mail.example.org Subject: quarterly numbers attached\n"
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write(line * (megabytes * 1024 * 1024 // len(line)))
+    try:
+        start = time.perf_counter()
+        with open(path, 'r', encoding='utf-8') as file:
+            expected = extract_emails(file.read())
+        baseline = time.perf_counter() - start
+        print(f"Extracting emails from {megabytes} MiB:")
+        print(f"  extract_emails(whole text):  {baseline:6.2f} s")
+        for workers in sorted({1, 2, os.cpu_count() or 1}):
+            start = time.perf_counter()
+            found = list(extract_emails_from_file(path, workers=workers, chunk_size=chunk_size))
+            elapsed = time.perf_counter() - start
+            assert found == expected
+            print(f"  extract_emails_from_file({workers} worker{'s' if workers > 1 else ''}): {elapsed:6.2f} s")
+    finally:
+        os.remove(path)
+
+
+def benchmark_scanner(repeat=2_000):
+    """One Scanner pass vs the separate extraction functions"""
+    text = ("Meeting on 2023-10-26 with support@example.com and sales.team@corp.co.uk; "
+            "follow-up 2023-11-02, budget 1200 units. ") * repeat
+    date_regex = re.compile(r'\b\d{4}-\d{2}-\d{2}\b')
+    scanner = Scanner()
+
+    start = time.perf_counter()
+    emails = extract_emails(text)
+    dates = date_regex.findall(text)
+    tokens = [word for word in split_by_non_alphanumeric(text) if word]
+    separate = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = scanner.scan(text)
+    combined = time.perf_counter() - start
+
+    assert result["emails"] == emails and result["dates"] == dates
+    print(f"Scanning {len(text) / 1e6:.1f} MB of text:")
+    print(f"  separate functions: {separate * 1000:7.1f} ms ({len(tokens):,} tokens incl. email/date parts)")
+    print(f"  Scanner.scan():     {combined * 1000:7.1f} ms ({len(result['tokens']):,} other tokens)")
+
+
+def benchmark_replacer(text_repeat=200, sample=50):
+    """Replacer vs one replace_word() call per dictionary word"""
+    text = "The quick brown fox jumps over the lazy dog while word00042 and word31337 watch. " * text_repeat
+    print(f"Replacing words in {len(text) / 1e3:.0f} kB of text:")
+    for size in (10, 1_000, 100_000):
+        mapping = {f"word{i:05d}": f"W{i}" for i in range(size)}
+        mapping.update(quick="FAST", lazy="SLEEPY")
+        words = list(mapping.items())
+
+        # Time a sample of replace_word() calls and extrapolate to the whole dict
+        start = time.perf_counter()
+        for old, new in words[:sample]:
+            replace_word(text, old, new)
+        sequential = (time.perf_counter() - start) / min(sample, len(words)) * len(words)
+
+        start = time.perf_counter()
+        replacer = Replacer(mapping)
+        build = time.perf_counter() - start
+        start = time.perf_counter()
+        result = replacer.replace(text)
+        one_pass = time.perf_counter() - start
+
+        expected = text
+        for old in ("quick", "lazy", "word00042", "word31337"):
+            if old in mapping:
+                expected = replace_word(expected, old, mapping[old])
+        assert result == expected
+        print(f"  {len(mapping):>7,} words: replace_word() loop ~{sequential:8.3f} s, "
+              f"Replacer[{replacer.strategy}] {one_pass * 1000:6.1f} ms (+{build * 1000:.0f} ms build)")
+
+
+def benchmark_validate_dates(count=1_000_000):
+    """validate_date() per value vs validate_dates() on strings and on a bytes buffer"""
+    dates = [f"{1900 + i % 150:04d}-{1 + i % 12:02d}-{1 + i % 31:02d}" for i in range(count)]
+    dates[::10] = ["not-a-date"] * len(dates[::10])
+    buffer = "\n".join(dates).encode('ascii')
+
+    start = time.perf_counter()
+    format_valid = sum(map(validate_date, dates))
+    per_call = time.perf_counter() - start
+
+    start = time.perf_counter()
+    valid = validate_dates(dates)
+    bulk = time.perf_counter() - start
+
+    start = time.perf_counter()
+    valid_bytes = validate_dates(buffer)
+    bulk_bytes = time.perf_counter() - start
+
+    assert valid == valid_bytes
+    print(f"Validating {count:,} dates:")
+    print(f"  validate_date() per value:  {per_call * 1000:7.1f} ms ({format_valid:,} well-formed)")
+    print(f"  validate_dates(strings):    {bulk * 1000:7.1f} ms ({sum(valid):,} real dates)")
+    print(f"  validate_dates(bytes):      {bulk_bytes * 1000:7.1f} ms")
+
+
+def benchmark_word_counts(path="words_benchmark.txt", sizes=(4, 16), chunk_size=4 * 1024 * 1024):
+    """Peak memory and time of split_by_non_alphanumeric() + Counter vs word_counts()"""
+    line = "It was the best of times, it was the worst of times; naïve café-owners 2023 counted_words.\n"
+    for megabytes in sizes:
+        with open(path, 'w', encoding='utf-8') as file:
+            for _ in range(megabytes):
+                file.write(line * (1024 * 1024 // len(line)))
+        try:
+            def whole_text():
+                with open(path, 'r', encoding='utf-8') as file:
+                    return Counter(word for word in split_by_non_alphanumeric(file.read()) if word)
+
+            runs = [("split + Counter", whole_text)]
+            for workers in sorted({1, os.cpu_count() or 1}):
+                runs.append((f"word_counts({workers} worker{'s' if workers > 1 else ''})",
+                             partial(word_counts, path, workers, chunk_size)))
+            results = []
+            print(f"Counting words in {megabytes} MiB:")
+            for label, count in runs:
+                start = time.perf_counter()
+                results.append(count())
+                elapsed = time.perf_counter() - start
+                # Peak measured on a second run: tracemalloc slows allocation
+                # down and only sees this process, not pool workers
+                tracemalloc.start()
+                count()
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                print(f"  {label:<24} {elapsed:6.2f} s, peak {peak / 1024 / 1024:7.2f} MiB")
+            assert all(result == results[0] for result in results)
+        finally:
+            os.remove(path)
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
+    # Benchmarks are slow and write large temporary files: run them with --benchmark
+    if '--benchmark' in sys.argv:
+        benchmark_email_extraction()
+        print()
+        benchmark_scanner()
+        print()
+        benchmark_replacer()
+        print()
+        benchmark_validate_dates()
+        print()
+        benchmark_word_counts()
\ No newline at end of file